@@ -9,18 +9,26 @@ Usage:
     python pump_mqtt_publisher.py
 
 Requirements:
-    pip install paho-mqtt python-dotenv
+    pip install paho-mqtt python-dotenv fastjsonschema orjson
 """
 
-import json
 import time
 import random
 import os
+import re
+import socket
+import sys
+import tempfile
+import importlib.util
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 import paho.mqtt.client as mqtt
 import logging
-from jsonschema import validate, ValidationError
+import fastjsonschema
+import orjson
 
 # =============================================================================
 # ENVIRONMENT CONFIGURATION
@@ -29,70 +37,144 @@ from jsonschema import validate, ValidationError
 # Load environment variables from .env file
 load_dotenv()
 
-# MQTT Broker Configuration
-BROKER_ADDRESS = os.getenv("MQTT_BROKER_HOST", "localhost")
-BROKER_PORT = int(os.getenv("MQTT_BROKER_PORT", "1883"))
-USERNAME = os.getenv("MQTT_BROKER_USERNAME", "")
-PASSWORD = os.getenv("MQTT_BROKER_PASSWORD", "")
-MQTT_CLIENT_ID = os.getenv("MQTT_CLIENT_ID", "uns-payload-example")
-MQTT_KEEPALIVE = int(os.getenv("MQTT_KEEPALIVE", "60"))
-MQTT_QOS = int(os.getenv("MQTT_QOS", "1"))
-
-# MQTT Topic Configuration
-MQTT_TOPIC_ENTERPRISE = os.getenv("MQTT_TOPIC_ENTERPRISE", "abelara")
-MQTT_TOPIC_SITE = os.getenv("MQTT_TOPIC_SITE", "plant1")
-MQTT_TOPIC_AREA = os.getenv("MQTT_TOPIC_AREA", "utilities")
-MQTT_TOPIC_LINE = os.getenv("MQTT_TOPIC_LINE", "water-system")
-MQTT_TOPIC_CELL = os.getenv("MQTT_TOPIC_CELL", "pump-station")
+@dataclass(frozen=True)
+class Config:
+    """Publisher settings, read once from the environment by load_config()"""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        "broker_address", "broker_port", "username", "password", "client_id",
+        "keepalive", "qos", "telemetry_qos", "max_inflight", "max_queued", "confirm_timeout",
+        "topic_enterprise", "topic_site", "topic_area", "topic_line", "topic_cell",
+        "publish_interval", "enable_random_variation", "log_level", "verbose", "validate_sample_rate",
+        "use_tls", "ca_cert_path", "client_cert_path", "client_key_path", "use_auth"
+    )
+    
+    # MQTT Broker Configuration
+    broker_address: str
+    broker_port: int
+    username: str
+    password: str
+    client_id: str
+    keepalive: int
+    qos: int
+    telemetry_qos: int
+    # paho sends up to max_inflight QoS 1/2 messages before waiting for
+    # acknowledgements and queues up to max_queued behind them (0 = unlimited)
+    max_inflight: int
+    max_queued: int
+    # Seconds to wait at the end of a cycle for QoS 1/2 acknowledgements (0 = don't wait);
+    # capped at half of publish_interval so a slow broker cannot stall every cycle
+    confirm_timeout: float
+    
+    # MQTT Topic Configuration
+    topic_enterprise: str
+    topic_site: str
+    topic_area: str
+    topic_line: str
+    topic_cell: str
+    
+    # Publisher Configuration
+    publish_interval: int
+    enable_random_variation: bool
+    log_level: str
+    # Print every published message instead of one summary line per cycle
+    verbose: bool
+    # Validate one in every validate_sample_rate payloads (1 = all, 0 = none)
+    validate_sample_rate: int
+    
+    # Optional: TLS/SSL Configuration
+    use_tls: bool
+    ca_cert_path: str
+    client_cert_path: str
+    client_key_path: str
+    
+    # Optional: Authentication
+    use_auth: bool
+
+def load_config():
+    """Read all publisher settings from the environment"""
+    return Config(
+        broker_address=os.getenv("MQTT_BROKER_HOST", "localhost"),
+        broker_port=int(os.getenv("MQTT_BROKER_PORT", "1883")),
+        username=os.getenv("MQTT_BROKER_USERNAME", ""),
+        password=os.getenv("MQTT_BROKER_PASSWORD", ""),
+        client_id=os.getenv("MQTT_CLIENT_ID", "uns-payload-example"),
+        keepalive=int(os.getenv("MQTT_KEEPALIVE", "60")),
+        qos=int(os.getenv("MQTT_QOS", "1")),
+        telemetry_qos=int(os.getenv("MQTT_TELEMETRY_QOS", "0")),
+        max_inflight=int(os.getenv("MQTT_MAX_INFLIGHT", "1000")),
+        max_queued=int(os.getenv("MQTT_MAX_QUEUED", "100000")),
+        confirm_timeout=float(os.getenv("MQTT_CONFIRM_TIMEOUT", "2")),
+        topic_enterprise=os.getenv("MQTT_TOPIC_ENTERPRISE", "abelara"),
+        topic_site=os.getenv("MQTT_TOPIC_SITE", "plant1"),
+        topic_area=os.getenv("MQTT_TOPIC_AREA", "utilities"),
+        topic_line=os.getenv("MQTT_TOPIC_LINE", "water-system"),
+        topic_cell=os.getenv("MQTT_TOPIC_CELL", "pump-station"),
+        publish_interval=int(os.getenv("PUBLISH_INTERVAL", "5")),
+        enable_random_variation=os.getenv("SIMULATION_MODE", "true").lower() == "true",
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        verbose=os.getenv("VERBOSE", "false").lower() == "true",
+        validate_sample_rate=int(os.getenv("VALIDATE_SAMPLE_RATE", "0")),
+        use_tls=os.getenv("MQTT_USE_TLS", "false").lower() == "true",
+        ca_cert_path=os.getenv("MQTT_CA_CERT_PATH", ""),
+        client_cert_path=os.getenv("MQTT_CLIENT_CERT_PATH", ""),
+        client_key_path=os.getenv("MQTT_CLIENT_KEY_PATH", ""),
+        use_auth=os.getenv("MQTT_USE_AUTH", "false").lower() == "true"
+    )
+
+CONFIG = load_config()
+
+# QoS per schema: telemetry is republished every cycle, so a lost message is
+# replaced on the next one and does not need broker acknowledgements. Schemas
+# not listed here (alerts, state, asset, ...) keep CONFIG.qos.
+QOS_BY_SCHEMA = {
+    "reading": CONFIG.telemetry_qos,
+    "measurement": CONFIG.telemetry_qos,
+    "count": CONFIG.telemetry_qos,
+    "kpi": CONFIG.telemetry_qos,
+    "value": CONFIG.telemetry_qos
+}
 
 # Asset Configuration
 """
 Asset Configuration for multiple pumps
 """
+# Pump records are read in every payload builder; attribute access on a
+# namedtuple is cheaper than a dict key lookup
+Pump = namedtuple("Pump", "id name description parent_id parent_name")
+
 PUMPS = [
-    {
-        "id": 101,
-        "name": "Pump-101",
-        "description": "Centrifugal water pump for cooling system",
-        "parent_id": 22,
-        "parent_name": "Pump Station 1"
-    },
-    {
-        "id": 102,
-        "name": "Pump-102",
-        "description": "Centrifugal water pump for cooling system",
-        "parent_id": 22,
-        "parent_name": "Pump Station 1"
-    },
-    {
-        "id": 103,
-        "name": "Pump-103",
-        "description": "Centrifugal water pump for cooling system",
-        "parent_id": 22,
-        "parent_name": "Pump Station 1"
-    }
+    Pump(
+        id=101,
+        name="Pump-101",
+        description="Centrifugal water pump for cooling system",
+        parent_id=22,
+        parent_name="Pump Station 1"
+    ),
+    Pump(
+        id=102,
+        name="Pump-102",
+        description="Centrifugal water pump for cooling system",
+        parent_id=22,
+        parent_name="Pump Station 1"
+    ),
+    Pump(
+        id=103,
+        name="Pump-103",
+        description="Centrifugal water pump for cooling system",
+        parent_id=22,
+        parent_name="Pump Station 1"
+    )
 ]
 
-# Publisher Configuration
-PUBLISH_INTERVAL = int(os.getenv("PUBLISH_INTERVAL", "5"))
-ENABLE_RANDOM_VARIATION = os.getenv("SIMULATION_MODE", "true").lower() == "true"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-
-# Optional: TLS/SSL Configuration
-MQTT_USE_TLS = os.getenv("MQTT_USE_TLS", "false").lower() == "true"
-MQTT_CA_CERT_PATH = os.getenv("MQTT_CA_CERT_PATH", "")
-MQTT_CLIENT_CERT_PATH = os.getenv("MQTT_CLIENT_CERT_PATH", "")
-MQTT_CLIENT_KEY_PATH = os.getenv("MQTT_CLIENT_KEY_PATH", "")
-
-# Optional: Authentication
-MQTT_USE_AUTH = os.getenv("MQTT_USE_AUTH", "false").lower() == "true"
-
 # =============================================================================
 # LOGGING CONFIGURATION
 # =============================================================================
 
+# Log to stdout so log records and console output share one ordered stream
 logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
+    stream=sys.stdout,
+    level=getattr(logging, CONFIG.log_level),
     format='%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%H:%M:%S'
 )
@@ -102,8 +184,71 @@ logger = logging.getLogger(__name__)
 # SCHEMA VALIDATION
 # =============================================================================
 
+# Generated validator code is cached here so restarts skip schema compilation
+SCHEMA_CACHE_DIR = os.path.join(os.path.dirname(__file__), '__schema_cache__')
+
+# First line of every cached validator; a cache written by another
+# fastjsonschema release is regenerated rather than trusted
+SCHEMA_CACHE_HEADER = f"# Generated by fastjsonschema {fastjsonschema.VERSION}\n"
+
+def schema_cache_is_current(cache_file, schema_file):
+    """Check that a cached validator is newer than its schema and from this fastjsonschema"""
+    try:
+        if os.path.getmtime(cache_file) < os.path.getmtime(schema_file):
+            return False
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.readline() == SCHEMA_CACHE_HEADER
+    except OSError:
+        return False
+
+def write_schema_cache(cache_file, schema):
+    """Generate a validator module for a schema and atomically replace its cache file"""
+    code = fastjsonschema.compile_to_code(schema)
+    # The first generated function validates the schema root
+    root_function = re.search(r'^def (\w+)\(', code, re.MULTILINE).group(1)
+    os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+    # Write next to the target so os.replace never exposes a partial module
+    fd, tmp_file = tempfile.mkstemp(dir=SCHEMA_CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(f"{SCHEMA_CACHE_HEADER}{code}\n\nvalidate = {root_function}\n")
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+def load_cached_validator(schema_name, cache_file):
+    """Import a cached validator module and return its root validation function"""
+    spec = importlib.util.spec_from_file_location(f"schema_cache_{schema_name}", cache_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+def compile_schema(schema_name, schema_file):
+    """Compile a JSON schema, reusing the generated validator module cached on disk"""
+    cache_file = os.path.join(SCHEMA_CACHE_DIR, f"{schema_name}.py")
+    if schema_cache_is_current(cache_file, schema_file):
+        try:
+            return load_cached_validator(schema_name, cache_file)
+        except Exception as e:
+            logger.warning("Cached validator for %s is unusable, recompiling: %s", schema_name, e)
+    
+    with open(schema_file, 'rb') as f:
+        schema = orjson.loads(f.read())
+    try:
+        write_schema_cache(cache_file, schema)
+        validator = load_cached_validator(schema_name, cache_file)
+    except Exception as e:
+        logger.debug("Could not cache compiled schema %s: %s", schema_name, e)
+        return fastjsonschema.compile(schema)
+    logger.debug("Compiled schema: %s", schema_name)
+    return validator
+
 def load_schemas():
-    """Load all JSON schemas for validation"""
+    """Load all JSON schemas and compile a validator function for each one"""
     schemas = {}
     schema_dir = os.path.join(os.path.dirname(__file__), '..', 'schemas')
     
@@ -123,32 +268,49 @@ def load_schemas():
     for schema_name, schema_path in schema_files.items():
         try:
             full_path = os.path.join(schema_dir, schema_path)
-            with open(full_path, 'r') as f:
-                schemas[schema_name] = json.load(f)
-            logger.debug(f"Loaded schema: {schema_name}")
+            # Compile the schema into plain Python code once so each publish
+            # only runs the generated checks
+            schemas[schema_name] = compile_schema(schema_name, full_path)
+            logger.debug("Loaded schema: %s", schema_name)
         except Exception as e:
-            logger.warning(f"Could not load schema {schema_name}: {e}")
+            logger.warning("Could not load schema %s: %s", schema_name, e)
     
     return schemas
 
+def log_validation_error(schema_name, error):
+    """Report a schema validation failure with the failing path and rule"""
+    # error.path starts with the root "data" element
+    path = ' -> '.join(str(p) for p in error.path[1:]) if len(error.path) > 1 else 'root'
+    expected = f"\n   Expected: {error.rule_definition}" if error.rule_definition else ""
+    logger.error(
+        "❌ Schema validation failed for %s:\n"
+        "   Error: %s\n"
+        "   Path: %s%s",
+        schema_name, error.message, path, expected
+    )
+
 def validate_payload(payload, schema_name, schemas):
-    """Validate a payload against its schema"""
-    if schema_name not in schemas:
-        logger.warning(f"No schema found for {schema_name}, skipping validation")
-        print(f"⚠️  No schema found for {schema_name}, skipping validation")
+    """Validate a payload against its compiled schema validator"""
+    validator = schemas.get(schema_name)
+    if validator is None:
+        logger.warning("⚠️  No schema found for %s, skipping validation", schema_name)
         return True
     
+    # Keep the success path to the validator call; error formatting lives
+    # in log_validation_error() and only runs when a payload is rejected
     try:
-        validate(instance=payload, schema=schemas[schema_name])
-        return True
-    except ValidationError as e:
-        logger.error(f"Schema validation failed for {schema_name}: {e}")
-        print(f"❌ Schema validation failed for {schema_name}:")
-        print(f"   Error: {e.message}")
-        print(f"   Path: {' -> '.join(str(p) for p in e.absolute_path) if e.absolute_path else 'root'}")
-        if e.validator_value:
-            print(f"   Expected: {e.validator_value}")
+        validator(payload)
+    except fastjsonschema.JsonSchemaValueException as e:
+        log_validation_error(schema_name, e)
         return False
+    return True
+
+def should_validate():
+    """Decide whether the next payload is sampled for schema validation"""
+    rate = CONFIG.validate_sample_rate
+    if rate <= 1:
+        return rate == 1
+    return random.randrange(rate) == 0
 
 # Load schemas at startup
 SCHEMAS = load_schemas()
@@ -157,43 +319,50 @@ SCHEMAS = load_schemas()
 # MQTT CLIENT SETUP
 # =============================================================================
 
+# Socket send buffer size in bytes, sized to hold a full publish cycle
+SOCKET_SEND_BUFFER = 256 * 1024
+
 def on_connect(client, userdata, flags, rc):
     """Called when connected to MQTT broker"""
     if rc == 0:
-        logger.info(f"Connected to MQTT broker at {BROKER_ADDRESS}:{BROKER_PORT}")
-        print(f"✅ Connected to MQTT broker at {BROKER_ADDRESS}:{BROKER_PORT}")
+        # Disable Nagle's algorithm so small PUBLISH packets are sent right away
+        # instead of being held back to coalesce with later writes
+        sock = client.socket()
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # A larger send buffer lets a whole cycle's burst of publishes be
+            # written without the network thread blocking on a full socket
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
+        logger.info("✅ Connected to MQTT broker at %s:%s", CONFIG.broker_address, CONFIG.broker_port)
     else:
-        logger.error(f"Failed to connect to MQTT broker. Return code: {rc}")
-        print(f"❌ Failed to connect to MQTT broker. Return code: {rc}")
+        logger.error("❌ Failed to connect to MQTT broker. Return code: %s", rc)
 
 def on_publish(client, userdata, mid):
     """Called when message is published"""
-    logger.debug(f"Published message ID: {mid}")
-    print(f"📤 Published message ID: {mid}")
+    logger.debug("Published message ID: %s", mid)
 
 def on_disconnect(client, userdata, rc):
     """Called when disconnected from MQTT broker"""
-    logger.info(f"Disconnected from MQTT broker. Return code: {rc}")
-    print(f"🔌 Disconnected from MQTT broker. Return code: {rc}")
+    logger.info("🔌 Disconnected from MQTT broker. Return code: %s", rc)
 
 # Create MQTT client
-client = mqtt.Client(client_id=MQTT_CLIENT_ID)
+client = mqtt.Client(client_id=CONFIG.client_id)
 client.on_connect = on_connect
 client.on_publish = on_publish
 client.on_disconnect = on_disconnect
 
 # Set authentication if provided
-if MQTT_USE_AUTH and USERNAME and PASSWORD:
-    client.username_pw_set(USERNAME, PASSWORD)
+if CONFIG.use_auth and CONFIG.username and CONFIG.password:
+    client.username_pw_set(CONFIG.username, CONFIG.password)
 
 # Enable TLS/SSL if configured
-if MQTT_USE_TLS:
-    if MQTT_CA_CERT_PATH and MQTT_CLIENT_CERT_PATH and MQTT_CLIENT_KEY_PATH:
+if CONFIG.use_tls:
+    if CONFIG.ca_cert_path and CONFIG.client_cert_path and CONFIG.client_key_path:
         # Use certificate-based TLS
         client.tls_set(
-            ca_certs=MQTT_CA_CERT_PATH,
-            certfile=MQTT_CLIENT_CERT_PATH,
-            keyfile=MQTT_CLIENT_KEY_PATH
+            ca_certs=CONFIG.ca_cert_path,
+            certfile=CONFIG.client_cert_path,
+            keyfile=CONFIG.client_key_path
         )
     else:
         # Use basic TLS without certificates
@@ -210,39 +379,242 @@ def get_timestamp():
 
 def add_variation(base_value, variation_percent=3):
     """Add realistic variation to values - reduced from 5% to 3% for more stable readings"""
-    if not ENABLE_RANDOM_VARIATION:
+    if not CONFIG.enable_random_variation:
         return base_value
     variation = base_value * (variation_percent / 100)
     return base_value + random.uniform(-variation, variation)
 
+def add_variations(base_values, variation_percent=3):
+    """Add realistic variation to a batch of values in a single pass"""
+    if not CONFIG.enable_random_variation:
+        return list(base_values)
+    # Same distribution as add_variation(), but drawing from random.random()
+    # directly keeps the loop free of Python-level random.uniform() frames
+    spread = 2 * variation_percent / 100
+    rand = random.random
+    return [base * (1 + spread * (rand() - 0.5)) for base in base_values]
+
 # =============================================================================
 # SCHEMA PAYLOADS
 # =============================================================================
 
-def create_asset_payload(pump):
-    """Create Asset schema payload for a given pump"""
+# Constant payload sub-trees shared by reference across payloads and cycles
+PUMP_ASSET_TYPE = {
+    "id": 1,
+    "name": "Centrifugal Pump",
+    "description": "Centrifugal pump equipment"
+}
+
+PRODUCT_FAMILY = {
+    "id": 1,
+    "name": "Utilities",
+    "description": "Utility products and services"
+}
+
+PRODUCT_SPECIFICATIONS = {
+    "temperature": "15-25°C",
+    "pressure": "3-8 bar",
+    "quality": "Process Grade",
+    "chlorinated": True
+}
+
+PRODUCT_REGULATORY_COMPLIANCE = ["ISO 14001", "Water Quality Standards"]
+
+# Product references embedded in value and production payloads
+COOLING_WATER_PRODUCT_REF = {
+    "id": 1,
+    "name": "Cooling Water",
+    "description": "Process cooling water"
+}
+
+COOLING_WATER_PRODUCT = {
+    "id": 1,
+    "name": "Cooling Water",
+    "description": "Process cooling water",
+    "family": PRODUCT_FAMILY
+}
+
+COOLING_WATER_PRODUCT_DETAILS = {
+    "id": 1,
+    "name": "Cooling Water",
+    "description": "Process cooling water for heat exchange systems",
+    "idealCycleTime": 3600,
+    "tolerance": 0.05,
+    "unit": "m³/h",
+    "family": PRODUCT_FAMILY
+}
+
+PUMP_STATES = (
+    {"id": 1, "name": "Running", "description": "Equipment is operating normally", "color": "#00FF00"},
+    {"id": 2, "name": "Starting", "description": "Equipment startup sequence", "color": "#FFFF00"},
+    {"id": 3, "name": "Stopping", "description": "Equipment shutdown sequence", "color": "#FFA500"},
+    {"id": 4, "name": "Fault", "description": "Equipment fault condition", "color": "#FF0000"},
+    {"id": 5, "name": "Maintenance", "description": "Equipment under maintenance", "color": "#800080"}
+)
+
+# State payload blocks derived from PUMP_STATES, indexed like PUMP_STATES
+STATE_DESCRIPTIONS = tuple(f"Pump is {state['name'].lower()}" for state in PUMP_STATES)
+STATE_TYPE_REFS = tuple(
+    {"id": state["id"], "name": state["name"], "description": state["description"]}
+    for state in PUMP_STATES
+)
+PREVIOUS_STATE_REFS = tuple(
+    {
+        "id": state["id"],
+        "name": state["name"],
+        "description": state["description"],
+        "color": state["color"],
+        "type": state_type
+    }
+    for state, state_type in zip(PUMP_STATES, STATE_TYPE_REFS)
+)
+
+ALERT_TYPES = (
+    {"severity": 2, "code": "TEMP_WARN", "message": "Pump bearing temperature approaching warning threshold"},
+    {"severity": 3, "code": "TEMP_HIGH", "message": "Pump bearing temperature exceeds warning threshold"},
+    {"severity": 1, "code": "MAINT_DUE", "message": "Pump maintenance due within 100 hours"},
+    {"severity": 2, "code": "FLOW_LOW", "message": "Pump flow rate below target range"},
+    {"severity": 2, "code": "VIBRATION_HIGH", "message": "Pump vibration levels above normal range"},
+    {"severity": 3, "code": "PRESSURE_HIGH", "message": "Pump discharge pressure exceeds safety limit"}
+)
+
+# Count types reported in production payloads
+WATER_DELIVERED_COUNT_TYPE = {
+    "id": 1,
+    "name": "Water Delivered",
+    "description": "Total water delivered to cooling system",
+    "unit": "m³"
+}
+
+RUNTIME_HOURS_COUNT_TYPE = {
+    "id": 2,
+    "name": "Runtime Hours",
+    "description": "Total pump runtime hours",
+    "unit": "hours"
+}
+
+# Choice pools for randomized payload details
+OPERATING_MODES = ("AUTO", "MANUAL")
+STATE_OPERATORS = ("John Smith", "Jane Doe", "Bob Wilson")
+STAFF = ("John Smith", "Jane Doe", "Bob Wilson", "Mike Johnson", "Sarah Davis")
+MEASUREMENT_METHODS = ("Infrared Thermography", "Vibration Analysis", "Oil Sampling", "Laser Alignment", "Megger Test")
+MEASUREMENT_EQUIPMENT = ("Fluke Ti480", "SKF Microlog", "Spectro Scientific", "Easy-Laser", "Fluke 1507")
+MEASUREMENT_TRENDS = ("Improving", "Stable", "Deteriorating")
+MAINTENANCE_DEMANDS = ("Scheduled", "Condition Based", "Emergency")
+KPI_TRENDS = ("Improving", "Stable", "Declining")
+ALERT_ACKNOWLEDGERS = ("John Smith", "Jane Doe", "Bob Wilson", "Mike Johnson")
+ALERT_TRENDS = ("Rising", "Stable", "Falling")
+ALERT_ACTIONS = ("Monitor", "Check bearings", "Schedule maintenance", "Reduce load", "Check alignment")
+ALERT_PRIORITIES = ("Low", "Medium", "High", "Critical")
+SHIFTS = ("Day", "Night", "Weekend")
+DEMAND_LEVELS = ("Low", "Medium", "High")
+
+# Every formatted string a randomized identifier can take, so payload builders
+# pick one instead of formatting a random number on each call
+MAINTENANCE_BATCH_IDS = tuple(f"MAINT-2024-{n:03d}" for n in range(1, 1000))
+EDGE_SENSOR_URIS = tuple(f"opc://plc1/DB1.DBD{n}" for n in range(12, 31))
+COUNT_PRODUCTION_NAMES = tuple(f"Cooling System Operation {n}" for n in range(1, 101))
+PRODUCTION_RUN_URIS = tuple(f"production://cooling-system-2024-{n:03d}" for n in range(1, 1000))
+
+# Per-type settings for the multi-payload value builders, built once at import
+MeasurementType = namedtuple("MeasurementType", "id name description unit base_value target topic_suffix location")
+EdgeType = namedtuple("EdgeType", "id name description unit base_value topic_suffix location")
+# Counts increment by a random amount in [increment_min, increment_max] each cycle:
+# a float for fractional counts, a whole number otherwise
+CountType = namedtuple("CountType", "id name description unit base_value topic_suffix increment_min increment_max fractional")
+KpiType = namedtuple("KpiType", "id name description unit base_value topic_suffix")
+
+MEASUREMENT_TYPES = (
+    MeasurementType(id=1, name="Bearing Temperature", description="Precision bearing temperature measurement", unit="°C", base_value=72.5, target=70.0, topic_suffix="bearing-temperature", location="Drive End Bearing"),
+    MeasurementType(id=2, name="Vibration Analysis", description="Precision vibration measurement", unit="mm/s", base_value=1.8, target=1.2, topic_suffix="vibration-analysis", location="Drive End"),
+    MeasurementType(id=3, name="Oil Analysis", description="Oil quality measurement", unit="mg/kg", base_value=12.5, target=8.0, topic_suffix="oil-analysis", location="Oil Reservoir"),
+    MeasurementType(id=4, name="Alignment Check", description="Shaft alignment measurement", unit="mm", base_value=0.08, target=0.03, topic_suffix="alignment-check", location="Coupling"),
+    MeasurementType(id=5, name="Insulation Resistance", description="Motor insulation resistance", unit="MΩ", base_value=850, target=1000, topic_suffix="insulation-resistance", location="Motor")
+)
+
+EDGE_TYPES = (
+    EdgeType(id=1, name="Temperature", description="Temperature readings from process equipment", unit="°C", base_value=72.5, topic_suffix="temperature", location="Drive End Bearing"),
+    EdgeType(id=2, name="Pressure", description="Pressure readings from process equipment", unit="bar", base_value=7.2, topic_suffix="pressure", location="Discharge"),
+    EdgeType(id=3, name="Flow", description="Flow rate readings from process equipment", unit="m³/h", base_value=42.8, topic_suffix="flow", location="Discharge"),
+    EdgeType(id=4, name="Vibration", description="Vibration readings from process equipment", unit="mm/s", base_value=1.8, topic_suffix="vibration", location="Drive End"),
+    EdgeType(id=5, name="Current", description="Electrical current readings from process equipment", unit="A", base_value=9.2, topic_suffix="current", location="Motor"),
+    EdgeType(id=6, name="Voltage", description="Electrical voltage readings from process equipment", unit="V", base_value=418, topic_suffix="voltage", location="Motor"),
+    EdgeType(id=7, name="Power", description="Power consumption readings from process equipment", unit="kW", base_value=4.8, topic_suffix="power", location="Motor")
+)
+
+COUNT_TYPES = (
+    CountType(id=1, name="Gallons Delivered", description="Total gallons delivered to cooling system", unit="gallons", base_value=125000, topic_suffix="gallons-delivered", increment_min=80, increment_max=120, fractional=False),
+    CountType(id=2, name="Water Delivered", description="Total water delivered to cooling system", unit="m³", base_value=473, topic_suffix="water-delivered", increment_min=0.3, increment_max=0.45, fractional=True),
+    CountType(id=3, name="Runtime Hours", description="Total pump runtime hours", unit="hours", base_value=1250, topic_suffix="runtime-hours", increment_min=0.1, increment_max=0.2, fractional=True),
+    CountType(id=4, name="Starts", description="Total pump starts", unit="count", base_value=150, topic_suffix="starts", increment_min=0, increment_max=1, fractional=False),
+    CountType(id=5, name="Energy Consumed", description="Total energy consumed", unit="kWh", base_value=12500, topic_suffix="energy-consumed", increment_min=4.5, increment_max=5.5, fractional=True)
+)
+
+KPI_TYPES = (
+    KpiType(id=1, name="Pump Efficiency", description="Overall pump efficiency", unit="%", base_value=96.5, topic_suffix="efficiency"),
+    KpiType(id=2, name="Energy Efficiency", description="Energy efficiency ratio", unit="kWh/m³", base_value=0.115, topic_suffix="energy-efficiency"),
+    KpiType(id=3, name="MTBF", description="Mean Time Between Failures", unit="hours", base_value=8760, topic_suffix="mtbf")
+)
+
+# OEE components
+OEE_COMPONENTS = (
+    KpiType(id=4, name="Availability", description="Equipment availability percentage", unit="%", base_value=98.2, topic_suffix="availability"),
+    KpiType(id=5, name="Performance", description="Equipment performance percentage", unit="%", base_value=95.5, topic_suffix="performance"),
+    KpiType(id=6, name="Quality", description="Equipment quality percentage", unit="%", base_value=99.8, topic_suffix="quality"),
+    KpiType(id=7, name="OEE", description="Overall Equipment Effectiveness", unit="%", base_value=94.5, topic_suffix="oee")
+)
+
+# Base values of each table, varied in one add_variations() batch per call
+MEASUREMENT_BASE_VALUES = tuple(measurement.base_value for measurement in MEASUREMENT_TYPES)
+EDGE_BASE_VALUES = tuple(edge_type.base_value for edge_type in EDGE_TYPES)
+KPI_BASE_VALUES = tuple(kpi_type.base_value for kpi_type in KPI_TYPES)
+OEE_BASE_VALUES = tuple(oee_component.base_value for oee_component in OEE_COMPONENTS)
+
+# 15% tolerance for precision measurements, paired with the rounded value reported in payloads
+MEASUREMENT_TOLERANCES = tuple(
+    (measurement.target * 0.15, round(measurement.target * 0.15, 2))
+    for measurement in MEASUREMENT_TYPES
+)
+
+# OEE components publish under the oee topic path of the KPI topic
+OEE_TOPIC_SUFFIXES = tuple(f"oee/{oee_component.topic_suffix}" for oee_component in OEE_COMPONENTS)
+
+# Edge reading sources, in EDGE_TYPES order
+EDGE_SOURCES = tuple(f"{edge_type.name.lower()}-sensor" for edge_type in EDGE_TYPES)
+
+def slugify(name):
+    """Lower-case a display name and replace spaces with dashes for use in URIs"""
+    return name.lower().replace(' ', '-')
+
+def build_value_uris(pump):
+    """Build the measurement, KPI and OEE metadata URIs of a pump, in table order"""
+    pump_slug = pump.name.lower()
     return {
-        "timestamp": get_timestamp(),
-        "id": pump["id"],
-        "name": pump["name"],
-        "description": pump["description"],
-        "assetType": {
-            "id": 1,
-            "name": "Centrifugal Pump",
-            "description": "Centrifugal pump equipment"
-        },
+        "measurement": tuple(f"maintenance://{pump_slug}/{slugify(measurement.name)}" for measurement in MEASUREMENT_TYPES),
+        "kpi": tuple(f"kpi://{pump_slug}/{slugify(kpi_type.name)}" for kpi_type in KPI_TYPES),
+        "oee": tuple(f"oee://{pump_slug}/{slugify(oee_component.name)}" for oee_component in OEE_COMPONENTS)
+    }
+
+def build_asset_template(pump):
+    """Build the static part of a pump's Asset schema payload"""
+    return {
+        "timestamp": None,
+        "id": pump.id,
+        "name": pump.name,
+        "description": pump.description,
+        "assetType": PUMP_ASSET_TYPE,
         "parentAsset": {
-            "id": pump["parent_id"],
-            "name": pump["parent_name"],
+            "id": pump.parent_id,
+            "name": pump.parent_name,
             "description": "Primary water pump station"
         },
         "metadata": {
             "source": "asset-management",
-            "uri": f"asset://{pump['id']}",
+            "uri": f"asset://{pump.id}",
             "additionalInfo": {
                 "manufacturer": "Grundfos",
                 "model": "CR45-4",
-                "serialNumber": f"GF-2023-00{pump['id']}",
+                "serialNumber": f"GF-2023-00{pump.id}",
                 "installationDate": "2023-03-15",
                 "powerRating": "5.5 kW",
                 "maxFlow": "45 m³/h",
@@ -252,484 +624,360 @@ def create_asset_payload(pump):
         }
     }
 
-def create_state_payload(pump):
+def create_asset_payload(pump, ts=None):
+    """Create Asset schema payload for a given pump"""
+    if ts is None:
+        ts = get_timestamp()
+    payload = PAYLOAD_TEMPLATES[pump.id]["asset"].copy()
+    payload["timestamp"] = ts
+    return payload
+
+def create_state_payload(pump, ts=None):
     """Create State schema payload for a given pump"""
-    states = [
-        {"id": 1, "name": "Running", "description": "Equipment is operating normally", "color": "#00FF00"},
-        {"id": 2, "name": "Starting", "description": "Equipment startup sequence", "color": "#FFFF00"},
-        {"id": 3, "name": "Stopping", "description": "Equipment shutdown sequence", "color": "#FFA500"},
-        {"id": 4, "name": "Fault", "description": "Equipment fault condition", "color": "#FF0000"},
-        {"id": 5, "name": "Maintenance", "description": "Equipment under maintenance", "color": "#800080"}
-    ]
-    current_state = random.choice(states)
-    previous_state = random.choice([s for s in states if s["id"] != current_state["id"]])
+    if ts is None:
+        ts = get_timestamp()
+    current_index = random.randrange(len(PUMP_STATES))
+    current_state = PUMP_STATES[current_index]
+    # Offset by 1..N-1 so the previous state is any state except the current one
+    previous_index = (current_index + random.randrange(1, len(PUMP_STATES))) % len(PUMP_STATES)
     return {
-        "timestamp": get_timestamp(),
-        "description": f"Pump is {current_state['name'].lower()}",
+        "timestamp": ts,
+        "description": STATE_DESCRIPTIONS[current_index],
         "color": current_state["color"],
-        "type": {
-            "id": current_state["id"],
-            "name": current_state["name"],
-            "description": current_state["description"]
-        },
+        "type": STATE_TYPE_REFS[current_index],
         "metadata": {
             "source": "plc-controller",
             "uri": "opc://plc1/DB1.DBW0",
-            "asset": {
-                "id": pump["id"],
-                "name": pump["name"],
-                "description": pump["description"]
-            },
-            "previousState": {
-                "id": previous_state["id"],
-                "name": previous_state["name"],
-                "description": previous_state["description"],
-                "color": previous_state["color"],
-                "type": {
-                    "id": previous_state["id"],
-                    "name": previous_state["name"],
-                    "description": previous_state["description"]
-                }
-            },
+            "asset": PUMP_ASSET_REFS[pump.id],
+            "previousState": PREVIOUS_STATE_REFS[previous_index],
             "additionalInfo": {
-                "runTime": random.randint(1000, 5000),
-                "startupTime": datetime.now(timezone.utc).isoformat(),
-                "mode": random.choice(["AUTO", "MANUAL"]),
-                "operator": random.choice(["John Smith", "Jane Doe", "Bob Wilson"])
+                "runTime": random.randrange(1000, 5001),
+                "startupTime": ts,
+                "mode": random.choice(OPERATING_MODES),
+                "operator": random.choice(STATE_OPERATORS)
             }
         }
     }
 
-def create_measurement_payloads(pump):
-    """Create multiple Measurement schema payloads for precision maintenance and operator rounds"""
-    measurement_types = [
-        {"id": 1, "name": "Bearing Temperature", "description": "Precision bearing temperature measurement", "unit": "°C", "base_value": 72.5, "target": 70.0, "topic_suffix": "bearing-temperature", "location": "Drive End Bearing"},
-        {"id": 2, "name": "Vibration Analysis", "description": "Precision vibration measurement", "unit": "mm/s", "base_value": 1.8, "target": 1.2, "topic_suffix": "vibration-analysis", "location": "Drive End"},
-        {"id": 3, "name": "Oil Analysis", "description": "Oil quality measurement", "unit": "mg/kg", "base_value": 12.5, "target": 8.0, "topic_suffix": "oil-analysis", "location": "Oil Reservoir"},
-        {"id": 4, "name": "Alignment Check", "description": "Shaft alignment measurement", "unit": "mm", "base_value": 0.08, "target": 0.03, "topic_suffix": "alignment-check", "location": "Coupling"},
-        {"id": 5, "name": "Insulation Resistance", "description": "Motor insulation resistance", "unit": "MΩ", "base_value": 850, "target": 1000, "topic_suffix": "insulation-resistance", "location": "Motor"}
-    ]
-    
-    payloads = []
-    for measurement in measurement_types:
-        value = add_variation(measurement["base_value"])
-        tolerance = measurement["target"] * 0.15  # 15% tolerance for precision measurements
-        in_tolerance = abs(value - measurement["target"]) <= tolerance
+def create_measurement_payloads(pump, ts=None):
+    """Yield multiple Measurement schema payloads for precision maintenance and operator rounds"""
+    if ts is None:
+        ts = get_timestamp()
+    values = add_variations(MEASUREMENT_BASE_VALUES)
+    uris = VALUE_URIS[pump.id]["measurement"]
+    for measurement, value, uri, (tolerance, reported_tolerance) in zip(MEASUREMENT_TYPES, values, uris, MEASUREMENT_TOLERANCES):
+        in_tolerance = abs(value - measurement.target) <= tolerance
         
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "type": {
-                "id": measurement["id"],
-                "name": measurement["name"],
-                "description": measurement["description"]
+                "id": measurement.id,
+                "name": measurement.name,
+                "description": measurement.description
             },
             "value": round(value, 2),
-            "unit": measurement["unit"],
-            "target": measurement["target"],
-            "tolerance": round(tolerance, 2),
+            "unit": measurement.unit,
+            "target": measurement.target,
+            "tolerance": reported_tolerance,
             "inTolerance": in_tolerance,
             "metadata": {
                 "source": "precision-maintenance",
-                "uri": f"maintenance://{pump['name'].lower()}/{measurement['name'].lower().replace(' ', '-')}",
-                "asset": {
-                    "id": pump["id"],
-                    "name": pump["name"],
-                    "description": pump["description"]
-                },
+                "uri": uri,
+                "asset": PUMP_ASSET_REFS[pump.id],
                 "additionalInfo": {
-                    "technician": random.choice(["John Smith", "Jane Doe", "Bob Wilson", "Mike Johnson", "Sarah Davis"]),
-                    "measurementMethod": random.choice(["Infrared Thermography", "Vibration Analysis", "Oil Sampling", "Laser Alignment", "Megger Test"]),
-                    "equipmentUsed": random.choice(["Fluke Ti480", "SKF Microlog", "Spectro Scientific", "Easy-Laser", "Fluke 1507"]),
-                    "measurementDate": datetime.now(timezone.utc).isoformat(),
+                    "technician": random.choice(STAFF),
+                    "measurementMethod": random.choice(MEASUREMENT_METHODS),
+                    "equipmentUsed": random.choice(MEASUREMENT_EQUIPMENT),
+                    "measurementDate": ts,
                     "nextMeasurementDue": "2024-06-15",
-                    "trend": random.choice(["Improving", "Stable", "Deteriorating"]),
-                    "measurementLocation": measurement["location"]
-                }
-            },
-            "product": {
-                "id": 1,
-                "name": "Cooling Water",
-                "description": "Process cooling water",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
+                    "trend": random.choice(MEASUREMENT_TRENDS),
+                    "measurementLocation": measurement.location
                 }
             },
+            "product": COOLING_WATER_PRODUCT,
             "productionContext": {
-                "batchId": f"MAINT-2024-{random.randint(1, 999):03d}",
+                "batchId": random.choice(MAINTENANCE_BATCH_IDS),
                 "processStep": "Precision Maintenance",
-                "demand": random.choice(["Scheduled", "Condition Based", "Emergency"])
+                "demand": random.choice(MAINTENANCE_DEMANDS)
             }
         }
         
-        payloads.append((measurement["topic_suffix"], payload, f"{measurement['name']} measurement"))
-    
-    return payloads
-
-def create_edge_payloads(pump):
-    """Create multiple Edge schema payloads for different process readings"""
-    edge_types = [
-        {"id": 1, "name": "Temperature", "description": "Temperature readings from process equipment", "unit": "°C", "base_value": 72.5, "topic_suffix": "temperature", "location": "Drive End Bearing"},
-        {"id": 2, "name": "Pressure", "description": "Pressure readings from process equipment", "unit": "bar", "base_value": 7.2, "topic_suffix": "pressure", "location": "Discharge"},
-        {"id": 3, "name": "Flow", "description": "Flow rate readings from process equipment", "unit": "m³/h", "base_value": 42.8, "topic_suffix": "flow", "location": "Discharge"},
-        {"id": 4, "name": "Vibration", "description": "Vibration readings from process equipment", "unit": "mm/s", "base_value": 1.8, "topic_suffix": "vibration", "location": "Drive End"},
-        {"id": 5, "name": "Current", "description": "Electrical current readings from process equipment", "unit": "A", "base_value": 9.2, "topic_suffix": "current", "location": "Motor"},
-        {"id": 6, "name": "Voltage", "description": "Electrical voltage readings from process equipment", "unit": "V", "base_value": 418, "topic_suffix": "voltage", "location": "Motor"},
-        {"id": 7, "name": "Power", "description": "Power consumption readings from process equipment", "unit": "kW", "base_value": 4.8, "topic_suffix": "power", "location": "Motor"}
-    ]
-    
-    payloads = []
-    for edge_type in edge_types:
-        value = add_variation(edge_type["base_value"])
+        yield (measurement.topic_suffix, payload, f"{measurement.name} measurement")
+
+def create_edge_payloads(pump, ts=None):
+    """Yield multiple Edge schema payloads for different process readings"""
+    if ts is None:
+        ts = get_timestamp()
+    values = add_variations(EDGE_BASE_VALUES)
+    sensor_infos = EDGE_SENSOR_INFO[pump.id]
+    for edge_type, value, source, sensor_info in zip(EDGE_TYPES, values, EDGE_SOURCES, sensor_infos):
         
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "type": {
-                "id": edge_type["id"],
-                "name": edge_type["name"],
-                "description": edge_type["description"]
+                "id": edge_type.id,
+                "name": edge_type.name,
+                "description": edge_type.description
             },
             "value": round(value, 1),
-            "unit": edge_type["unit"],
+            "unit": edge_type.unit,
             "metadata": {
-                "source": f"{edge_type['name'].lower()}-sensor",
-                "uri": f"opc://plc1/DB1.DBD{random.randint(12, 30)}",
-                "asset": {
-                    "id": pump["id"],
-                    "name": pump["name"],
-                    "description": pump["description"]
-                },
-                "additionalInfo": {
-                    "sensorId": f"{edge_type['name'].upper().replace(' ', '')}-{pump['id']:03d}",
-                    "location": edge_type["location"],
-                    "alarmThreshold": edge_type["base_value"] * 1.2,
-                    "warningThreshold": edge_type["base_value"] * 1.1,
-                    "calibrationDate": "2024-01-15",
-                    "nextCalibration": "2024-07-15"
-                }
+                "source": source,
+                "uri": random.choice(EDGE_SENSOR_URIS),
+                "asset": PUMP_ASSET_REFS[pump.id],
+                "additionalInfo": sensor_info
             }
         }
         
-        payloads.append((edge_type["topic_suffix"], payload, f"{edge_type['name']} reading"))
-    
-    return payloads
-
-def create_count_payloads(pump):
-    """Create multiple Count schema payloads for different accumulated values"""
-    count_types = [
-        {"id": 1, "name": "Gallons Delivered", "description": "Total gallons delivered to cooling system", "unit": "gallons", "base_value": 125000, "topic_suffix": "gallons-delivered", "increment": lambda: random.randint(80, 120)},
-        {"id": 2, "name": "Water Delivered", "description": "Total water delivered to cooling system", "unit": "m³", "base_value": 473, "topic_suffix": "water-delivered", "increment": lambda: random.uniform(0.3, 0.45)},
-        {"id": 3, "name": "Runtime Hours", "description": "Total pump runtime hours", "unit": "hours", "base_value": 1250, "topic_suffix": "runtime-hours", "increment": lambda: random.uniform(0.1, 0.2)},
-        {"id": 4, "name": "Starts", "description": "Total pump starts", "unit": "count", "base_value": 150, "topic_suffix": "starts", "increment": lambda: random.randint(0, 1)},
-        {"id": 5, "name": "Energy Consumed", "description": "Total energy consumed", "unit": "kWh", "base_value": 12500, "topic_suffix": "energy-consumed", "increment": lambda: random.uniform(4.5, 5.5)}
-    ]
-    
-    payloads = []
-    for count_type in count_types:
-        increment = count_type["increment"]()
-        value = count_type["base_value"] + increment
+        yield (edge_type.topic_suffix, payload, f"{edge_type.name} reading")
+
+def build_edge_sensor_info(pump):
+    """Build the static sensor details of each edge reading for a pump, in EDGE_TYPES order"""
+    return tuple(
+        {
+            "sensorId": f"{edge_type.name.upper().replace(' ', '')}-{pump.id:03d}",
+            "location": edge_type.location,
+            "alarmThreshold": edge_type.base_value * 1.2,
+            "warningThreshold": edge_type.base_value * 1.1,
+            "calibrationDate": "2024-01-15",
+            "nextCalibration": "2024-07-15"
+        }
+        for edge_type in EDGE_TYPES
+    )
+
+def create_count_payloads(pump, ts=None):
+    """Yield multiple Count schema payloads for different accumulated values"""
+    if ts is None:
+        ts = get_timestamp()
+    for count_type in COUNT_TYPES:
+        fractional = count_type.fractional
+        if fractional:
+            increment = count_type.increment_min + (count_type.increment_max - count_type.increment_min) * random.random()
+        else:
+            increment = random.randrange(count_type.increment_min, count_type.increment_max + 1)
+        value = count_type.base_value + increment
+        flow_rate, efficiency, total_energy = add_variations((42.8, 96.5, 12500))
         
         payload = {
-            "timestamp": get_timestamp(),
-            "value": round(value, 1) if count_type["unit"] in ["m³", "hours", "kWh"] else int(value),
-            "unit": count_type["unit"],
+            "timestamp": ts,
+            "value": round(value, 1) if fractional else int(value),
+            "unit": count_type.unit,
             "type": {
-                "id": count_type["id"],
-                "name": count_type["name"],
-                "description": count_type["description"]
+                "id": count_type.id,
+                "name": count_type.name,
+                "description": count_type.description
             },
             "metadata": {
                 "source": "flow-counter",
                 "uri": "opc://plc1/DB1.DBD16",
-                "asset": {
-                    "id": pump["id"],
-                    "name": pump["name"],
-                    "description": pump["description"]
-                },
+                "asset": PUMP_ASSET_REFS[pump.id],
                 "production": {
-                    "id": random.randint(1000, 9999),
-                    "name": f"Cooling System Operation {random.randint(1, 100)}",
+                    "id": random.randrange(1000, 10000),
+                    "name": random.choice(COUNT_PRODUCTION_NAMES),
                     "description": "Continuous cooling system operation"
                 },
-                "product": {
-                    "id": 1,
-                    "name": "Cooling Water",
-                    "description": "Process cooling water"
-                },
+                "product": COOLING_WATER_PRODUCT_REF,
                 "additionalInfo": {
                     "maintenanceDue": 2500,
                     "lastMaintenance": "2024-01-15",
                     "nextMaintenance": "2024-06-15",
-                    "flowRate": round(add_variation(42.8), 1),
-                    "efficiency": round(add_variation(96.5), 1),
-                    "totalEnergy": round(add_variation(12500), 1),
-                    "increment": round(increment, 2) if count_type["unit"] in ["m³", "hours", "kWh"] else int(increment),
+                    "flowRate": round(flow_rate, 1),
+                    "efficiency": round(efficiency, 1),
+                    "totalEnergy": round(total_energy, 1),
+                    "increment": round(increment, 2) if fractional else int(increment),
                     "lastReset": "2024-01-01T00:00:00Z",
                     "nextReset": "2025-01-01T00:00:00Z"
                 }
             }
         }
         
-        payloads.append((count_type["topic_suffix"], payload, f"{count_type['name']} count"))
-    
-    return payloads
+        yield (count_type.topic_suffix, payload, f"{count_type.name} count")
 
-def create_kpi_payloads(pump):
-    """Create multiple KPI schema payloads for different performance metrics"""
-    kpi_types = [
-        {"id": 1, "name": "Pump Efficiency", "description": "Overall pump efficiency", "unit": "%", "base_value": 96.5, "topic_suffix": "efficiency"},
-        {"id": 2, "name": "Energy Efficiency", "description": "Energy efficiency ratio", "unit": "kWh/m³", "base_value": 0.115, "topic_suffix": "energy-efficiency"},
-        {"id": 3, "name": "MTBF", "description": "Mean Time Between Failures", "unit": "hours", "base_value": 8760, "topic_suffix": "mtbf"}
-    ]
-    
-    # OEE components
-    oee_components = [
-        {"id": 4, "name": "Availability", "description": "Equipment availability percentage", "unit": "%", "base_value": 98.2, "topic_suffix": "availability"},
-        {"id": 5, "name": "Performance", "description": "Equipment performance percentage", "unit": "%", "base_value": 95.5, "topic_suffix": "performance"},
-        {"id": 6, "name": "Quality", "description": "Equipment quality percentage", "unit": "%", "base_value": 99.8, "topic_suffix": "quality"},
-        {"id": 7, "name": "OEE", "description": "Overall Equipment Effectiveness", "unit": "%", "base_value": 94.5, "topic_suffix": "oee"}
-    ]
-    
-    payloads = []
+def create_kpi_payloads(pump, ts=None):
+    """Yield multiple KPI schema payloads for different performance metrics"""
+    if ts is None:
+        ts = get_timestamp()
     
     # Add regular KPIs
-    for kpi_type in kpi_types:
-        value = add_variation(kpi_type["base_value"])
-        
+    values = add_variations(KPI_BASE_VALUES)
+    uris = VALUE_URIS[pump.id]["kpi"]
+    for kpi_type, value, uri in zip(KPI_TYPES, values, uris):
+        input_power, output_power = add_variations((4.8, 4.63))
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "value": round(value, 2),
-            "unit": kpi_type["unit"],
+            "unit": kpi_type.unit,
             "type": {
-                "id": kpi_type["id"],
-                "name": kpi_type["name"],
-                "description": kpi_type["description"]
-            },
-            "product": {
-                "id": 1,
-                "name": "Cooling Water",
-                "description": "Process cooling water",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
-                }
+                "id": kpi_type.id,
+                "name": kpi_type.name,
+                "description": kpi_type.description
             },
+            "product": COOLING_WATER_PRODUCT,
             "metadata": {
                 "source": "kpi-calculator",
-                "uri": f"kpi://{pump['name'].lower()}/{kpi_type['name'].lower().replace(' ', '-')}",
-                "asset": {
-                    "id": pump["id"],
-                    "name": pump["name"]
-                },
+                "uri": uri,
+                "asset": PUMP_ASSET_NAME_REFS[pump.id],
                 "additionalInfo": {
                     "calculationPeriod": "1 hour",
-                    "inputPower": round(add_variation(4.8), 1),
-                    "outputPower": round(add_variation(4.63), 1),
+                    "inputPower": round(input_power, 1),
+                    "outputPower": round(output_power, 1),
                     "targetEfficiency": 95.0,
-                    "trend": random.choice(["Improving", "Stable", "Declining"]),
-                    "lastCalculation": datetime.now(timezone.utc).isoformat(),
-                    "baselineValue": kpi_type["base_value"],
-                    "improvement": round((value - kpi_type["base_value"]) / kpi_type["base_value"] * 100, 2)
+                    "trend": random.choice(KPI_TRENDS),
+                    "lastCalculation": ts,
+                    "baselineValue": kpi_type.base_value,
+                    "improvement": round((value - kpi_type.base_value) / kpi_type.base_value * 100, 2)
                 }
             }
         }
         
-        payloads.append((kpi_type["topic_suffix"], payload, f"{kpi_type['name']} KPI"))
+        yield (kpi_type.topic_suffix, payload, f"{kpi_type.name} KPI")
     
     # Add OEE components under oee topic path
-    for oee_component in oee_components:
-        value = add_variation(oee_component["base_value"])
-        
+    values = add_variations(OEE_BASE_VALUES)
+    uris = VALUE_URIS[pump.id]["oee"]
+    for oee_component, value, uri, topic_suffix in zip(OEE_COMPONENTS, values, uris, OEE_TOPIC_SUFFIXES):
+        production_time, cycle_time, good_units, total_units = add_variations((470, 3780, 125, 126))
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "value": round(value, 1),
-            "unit": oee_component["unit"],
+            "unit": oee_component.unit,
             "type": {
-                "id": oee_component["id"],
-                "name": oee_component["name"],
-                "description": oee_component["description"]
-            },
-            "product": {
-                "id": 1,
-                "name": "Cooling Water",
-                "description": "Process cooling water",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
-                }
+                "id": oee_component.id,
+                "name": oee_component.name,
+                "description": oee_component.description
             },
+            "product": COOLING_WATER_PRODUCT,
             "metadata": {
                 "source": "oee-calculator",
-                "uri": f"oee://{pump['name'].lower()}/{oee_component['name'].lower().replace(' ', '-')}",
-                "asset": {
-                    "id": pump["id"],
-                    "name": pump["name"]
-                },
+                "uri": uri,
+                "asset": PUMP_ASSET_NAME_REFS[pump.id],
                 "additionalInfo": {
                     "calculationPeriod": "1 hour",
                     "plannedProductionTime": 480,
-                    "actualProductionTime": round(add_variation(470), 1),
+                    "actualProductionTime": round(production_time, 1),
                     "idealCycleTime": 3600,
-                    "actualCycleTime": round(add_variation(3780), 1),
-                    "goodUnits": round(add_variation(125), 1),
-                    "totalUnits": round(add_variation(126), 1),
-                    "trend": random.choice(["Improving", "Stable", "Declining"]),
-                    "lastCalculation": datetime.now(timezone.utc).isoformat(),
+                    "actualCycleTime": round(cycle_time, 1),
+                    "goodUnits": round(good_units, 1),
+                    "totalUnits": round(total_units, 1),
+                    "trend": random.choice(KPI_TRENDS),
+                    "lastCalculation": ts,
                     "targetOEE": 95.0,
                     "worldClassOEE": 85.0
                 }
             }
         }
         
-        payloads.append((f"oee/{oee_component['topic_suffix']}", payload, f"{oee_component['name']} OEE"))
-    
-    return payloads
+        yield (topic_suffix, payload, f"{oee_component.name} OEE")
 
-def create_alert_payload(pump):
-    """Create Alert schema payload"""
-    alert_types = [
-        {"severity": 2, "code": "TEMP_WARN", "message": "Pump bearing temperature approaching warning threshold"},
-        {"severity": 3, "code": "TEMP_HIGH", "message": "Pump bearing temperature exceeds warning threshold"},
-        {"severity": 1, "code": "MAINT_DUE", "message": "Pump maintenance due within 100 hours"},
-        {"severity": 2, "code": "FLOW_LOW", "message": "Pump flow rate below target range"},
-        {"severity": 2, "code": "VIBRATION_HIGH", "message": "Pump vibration levels above normal range"},
-        {"severity": 3, "code": "PRESSURE_HIGH", "message": "Pump discharge pressure exceeds safety limit"}
-    ]
+def create_alert_payload(pump, ts=None, alert=None, is_acknowledged=None):
+    """Create Alert schema payload
     
-    alert = random.choice(alert_types)
-    is_acknowledged = random.choice([True, False])
+    The alert type and acknowledgment state are picked at random unless
+    given, which lets the self-test build every payload shape.
+    """
+    if ts is None:
+        ts = get_timestamp()
+    if alert is None:
+        alert = random.choice(ALERT_TYPES)
+    if is_acknowledged is None:
+        is_acknowledged = random.random() < 0.5
     
     # Build acknowledgment object
     acknowledgment = {
         "acknowledged": is_acknowledged,
-        "acknowledgedBy": random.choice(["John Smith", "Jane Doe", "Bob Wilson", "Mike Johnson"]) if is_acknowledged else None,
-        "acknowledgedAt": get_timestamp() if is_acknowledged else None
+        "acknowledgedBy": random.choice(ALERT_ACKNOWLEDGERS) if is_acknowledged else None,
+        "acknowledgedAt": ts if is_acknowledged else None
     }
     
     return {
-        "timestamp": get_timestamp(),
+        "timestamp": ts,
         "severity": alert["severity"],
         "code": alert["code"],
         "message": alert["message"],
         "metadata": {
             "source": "monitoring-system",
             "uri": "opc://plc1/DB1.DBD4",
-            "asset": {
-                "id": pump["id"],
-                "name": pump["name"],
-                "description": pump["description"]
-            },
+            "asset": PUMP_ASSET_REFS[pump.id],
             "acknowledgment": acknowledgment,
             "additionalInfo": {
                 "temperature": round(add_variation(76.5), 1),
                 "warningThreshold": 75.0,
                 "alarmThreshold": 85.0,
                 "sensorLocation": "Drive End Bearing",
-                "trend": random.choice(["Rising", "Stable", "Falling"]),
-                "timeInAlarm": random.randint(5, 30),
-                "recommendedAction": random.choice(["Monitor", "Check bearings", "Schedule maintenance", "Reduce load", "Check alignment"]),
-                "priority": random.choice(["Low", "Medium", "High", "Critical"])
+                "trend": random.choice(ALERT_TRENDS),
+                "timeInAlarm": random.randrange(5, 31),
+                "recommendedAction": random.choice(ALERT_ACTIONS),
+                "priority": random.choice(ALERT_PRIORITIES)
             }
         }
     }
 
-def create_product_payload(pump):
-    """Create Product schema payload"""
+def build_product_template(pump):
+    """Build the static part of a pump's Product schema payload"""
     return {
-        "timestamp": get_timestamp(),
+        "timestamp": None,
         "id": 1,
         "name": "Cooling Water",
         "description": "Process cooling water for heat exchange systems",
         "idealCycleTime": 3600,
         "tolerance": 0.05,
         "unit": "m³/h",
-        "family": {
-            "id": 1,
-            "name": "Utilities",
-            "description": "Utility products and services"
-        },
+        "family": PRODUCT_FAMILY,
         "metadata": {
             "source": "product-management",
             "uri": "product://cooling-water",
-            "asset": {
-                "id": pump["id"],
-                "name": pump["name"],
-                "description": pump["description"]
-            },
+            "asset": PUMP_ASSET_REFS[pump.id],
             "additionalInfo": {
-                "specifications": {
-                    "temperature": "15-25°C",
-                    "pressure": "3-8 bar",
-                    "quality": "Process Grade",
-                    "chlorinated": True
-                },
-                "regulatoryCompliance": ["ISO 14001", "Water Quality Standards"]
+                "specifications": PRODUCT_SPECIFICATIONS,
+                "regulatoryCompliance": PRODUCT_REGULATORY_COMPLIANCE
             }
         }
     }
 
-def create_production_payload(pump):
+def create_product_payload(pump, ts=None):
+    """Create Product schema payload"""
+    if ts is None:
+        ts = get_timestamp()
+    payload = PAYLOAD_TEMPLATES[pump.id]["product"].copy()
+    payload["timestamp"] = ts
+    return payload
+
+def create_production_payload(pump, ts=None):
     """Create Production schema payload"""
-    water_delivered = random.randint(320, 380)  # More realistic range
+    if ts is None:
+        ts = get_timestamp()
+    water_delivered = random.randrange(320, 381)  # More realistic range
     runtime_hours = random.uniform(6.5, 7.5)    # More realistic runtime
+    system_efficiency, energy_consumption, quality_score = add_variations((96.5, 32.8, 98.5))
     
     return {
-        "timestamp": get_timestamp(),
-        "start_ts": datetime.now(timezone.utc).isoformat(),
+        "timestamp": ts,
+        "start_ts": ts,
         "end_ts": None,
         "counts": [
             {
-                "type": {
-                    "id": 1,
-                    "name": "Water Delivered",
-                    "description": "Total water delivered to cooling system",
-                    "unit": "m³"
-                },
+                "type": WATER_DELIVERED_COUNT_TYPE,
                 "quantity": water_delivered,
-                "timestamp": get_timestamp()
+                "timestamp": ts
             },
             {
-                "type": {
-                    "id": 2,
-                    "name": "Runtime Hours",
-                    "description": "Total pump runtime hours",
-                    "unit": "hours"
-                },
+                "type": RUNTIME_HOURS_COUNT_TYPE,
                 "quantity": round(runtime_hours, 1),
-                "timestamp": get_timestamp()
+                "timestamp": ts
             }
         ],
         "metadata": {
             "source": "production-tracker",
-            "uri": f"production://cooling-system-2024-{random.randint(1, 999):03d}",
-            "asset": {
-                "id": pump["id"],
-                "name": pump["name"],
-                "description": pump["description"]
-            },
-            "product": {
-                "id": 1,
-                "name": "Cooling Water",
-                "description": "Process cooling water for heat exchange systems",
-                "idealCycleTime": 3600,
-                "tolerance": 0.05,
-                "unit": "m³/h",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
-                }
-            },
+            "uri": random.choice(PRODUCTION_RUN_URIS),
+            "asset": PUMP_ASSET_REFS[pump.id],
+            "product": COOLING_WATER_PRODUCT_DETAILS,
             "additionalInfo": {
-                "shift": random.choice(["Day", "Night", "Weekend"]),
-                "operator": random.choice(["John Smith", "Jane Doe", "Bob Wilson", "Mike Johnson", "Sarah Davis"]),
-                "demandLevel": random.choice(["Low", "Medium", "High"]),
-                "systemEfficiency": round(add_variation(96.5), 1),
-                "energyConsumption": round(add_variation(32.8), 1),
-                "qualityScore": round(add_variation(98.5), 1),
+                "shift": random.choice(SHIFTS),
+                "operator": random.choice(STAFF),
+                "demandLevel": random.choice(DEMAND_LEVELS),
+                "systemEfficiency": round(system_efficiency, 1),
+                "energyConsumption": round(energy_consumption, 1),
+                "qualityScore": round(quality_score, 1),
                 "plannedProduction": 350,
                 "actualProduction": water_delivered,
                 "efficiency": round((water_delivered / 350) * 100, 1)
@@ -737,6 +985,21 @@ def create_production_payload(pump):
         }
     }
 
+# Static payloads and subtrees are built once per pump. Builders make a shallow
+# copy and only set the fields that change; nested dicts are shared because
+# payloads are serialized and discarded, never mutated
+PUMP_ASSET_REFS = {
+    pump.id: {"id": pump.id, "name": pump.name, "description": pump.description}
+    for pump in PUMPS
+}
+PUMP_ASSET_NAME_REFS = {pump.id: {"id": pump.id, "name": pump.name} for pump in PUMPS}
+EDGE_SENSOR_INFO = {pump.id: build_edge_sensor_info(pump) for pump in PUMPS}
+VALUE_URIS = {pump.id: build_value_uris(pump) for pump in PUMPS}
+PAYLOAD_TEMPLATES = {
+    pump.id: {"asset": build_asset_template(pump), "product": build_product_template(pump)}
+    for pump in PUMPS
+}
+
 # =============================================================================
 # PAYLOAD DEFINITIONS
 # =============================================================================
@@ -759,148 +1022,348 @@ VALUE_PAYLOADS = {
     "edge": ("Edge sensor reading", create_edge_payloads)
 }
 
+# Flattened, fixed-order dispatch table for the publish loop:
+# (topic type, description, builder, builder returns multiple payloads)
+PAYLOAD_BUILDERS = tuple(
+    (schema_type, description, payload_func, False)
+    for schema_type, (description, payload_func) in SCHEMA_PAYLOADS.items()
+    if payload_func is not None
+) + tuple(
+    (value_type, description, payload_func, True)
+    for value_type, (description, payload_func) in VALUE_PAYLOADS.items()
+)
+
+def build_pump_topics(pump):
+    """Build every schema and value-type topic for a pump using UNS structure language"""
+    base_topic = f"{CONFIG.topic_enterprise}/{CONFIG.topic_site}/{CONFIG.topic_area}/{CONFIG.topic_line}/{CONFIG.topic_cell}/{pump.name.lower()}"
+    return {
+        topic_type: f"{base_topic}/{topic_type}"
+        for topic_type in list(SCHEMA_PAYLOADS) + list(VALUE_PAYLOADS)
+    }
+
+# Topic suffixes each value builder publishes under its value-type topic
+VALUE_TOPIC_SUFFIXES = {
+    "measurement": tuple(measurement.topic_suffix for measurement in MEASUREMENT_TYPES),
+    "count": tuple(count_type.topic_suffix for count_type in COUNT_TYPES),
+    "kpi": tuple(kpi_type.topic_suffix for kpi_type in KPI_TYPES) + OEE_TOPIC_SUFFIXES,
+    "edge": tuple(edge_type.topic_suffix for edge_type in EDGE_TYPES)
+}
+
+def build_value_topics(topics):
+    """Build the full topic of every value payload from a pump's value-type topics"""
+    return {
+        value_type: {suffix: f"{topics[value_type]}/{suffix}" for suffix in suffixes}
+        for value_type, suffixes in VALUE_TOPIC_SUFFIXES.items()
+    }
+
+# Topics only depend on static configuration, so build them once per pump
+PUMP_TOPICS = {pump.id: build_pump_topics(pump) for pump in PUMPS}
+PUMP_VALUE_TOPICS = {pump_id: build_value_topics(topics) for pump_id, topics in PUMP_TOPICS.items()}
+
 # =============================================================================
 # MAIN PUBLISHING LOOP
 # =============================================================================
 
-def publish_pump_data():
-    """Main function to publish pump data using all schema types"""
-    # Create MQTT client
-    client = mqtt.Client()
+def create_pump_client(pump):
+    """Create an MQTT client with its own connection for a single pump"""
+    client = mqtt.Client(client_id=f"{CONFIG.client_id}-{pump.id}")
     
     # Set up callbacks
     client.on_connect = on_connect
     client.on_disconnect = on_disconnect
-    client.on_publish = on_publish
+    # on_publish runs on paho's network thread for every message, so it is
+    # only registered when its debug output would actually be shown
+    if logger.isEnabledFor(logging.DEBUG):
+        client.on_publish = on_publish
+    
+    # Let the network thread started by loop_start() keep many messages in
+    # flight instead of paho's default of 20
+    client.max_inflight_messages_set(CONFIG.max_inflight)
+    client.max_queued_messages_set(CONFIG.max_queued)
     
     # Set up authentication if provided
-    if USERNAME and PASSWORD:
-        client.username_pw_set(USERNAME, PASSWORD)
+    if CONFIG.username and CONFIG.password:
+        client.username_pw_set(CONFIG.username, CONFIG.password)
     
     # Set up TLS if enabled
-    if MQTT_USE_TLS:
+    if CONFIG.use_tls:
         client.tls_set()
     
+    return client
+
+def build_pump_messages(pump, ts):
+    """Build one cycle of (topic, payload, description) messages for a single pump
+    
+    Returns the messages and the number of payloads the builders were due
+    to produce, which exceeds len(messages) when a builder raised.
+    """
+    messages = []
+    built = 0
+    topics = PUMP_TOPICS[pump.id]
+    value_topics = PUMP_VALUE_TOPICS[pump.id]
+    for topic_type, description, payload_func, multiple in PAYLOAD_BUILDERS:
+        # Payloads this builder should account for, so a builder that raises
+        # still shows its lost payloads in the cycle summary
+        expected = len(messages) + (len(VALUE_TOPIC_SUFFIXES[topic_type]) if multiple else 1)
+        try:
+            if multiple:
+                suffix_topics = value_topics[topic_type]
+                for topic_suffix, value_payload, value_desc in payload_func(pump, ts):
+                    topic = suffix_topics.get(topic_suffix) or f"{topics[topic_type]}/{topic_suffix}"
+                    messages.append((topic, value_payload, value_desc))
+            else:
+                messages.append((topics[topic_type], payload_func(pump, ts), description))
+        except Exception as e:
+            logger.error("❌ %-20s → Error building %s payload for %s: %s", description, topic_type, pump.name, e)
+            built += max(0, expected - len(messages))
+    return messages, built + len(messages)
+
+def publish_pump_cycle(client, pump, ts):
+    """Build and publish one cycle of payloads for a single pump
+    
+    Returns the number of payloads published, the number due to be built
+    (including any lost to builder errors), and the per-message console
+    report (empty unless VERBOSE is set).
+    """
+    # Build the whole cycle first, then publish it back to back so
+    # payload generation does not sit between consecutive publishes
+    messages, built = build_pump_messages(pump, ts)
+    # Console output per message is opt-in: print() takes the stdout lock
+    # and writes a line for every publish, which dwarfs the publish itself.
+    # Report lines are collected and printed by the main thread so pumps
+    # publishing in parallel do not interleave their output
+    verbose = CONFIG.verbose
+    lines = [f"📤 Publishing {len(messages)} payloads for {pump.name}..."] if verbose else []
+    pending = []
+    published = 0
+    for topic, payload, description in messages:
+        try:
+            if publish_payload(client, topic, payload, pending):
+                published += 1
+                if verbose:
+                    lines.append(f"  ✅ {description:20} → {topic}")
+            elif verbose:
+                lines.append(f"  ❌ {description:20} → Validation failed")
+        except Exception as e:
+            logger.error("❌ %-20s → Error publishing to %s: %s", description, topic, e)
+    confirm_publishes(pending, pump)
+    return published, built, lines
+
+def confirm_publishes(pending, pump):
+    """Wait once per cycle for the broker to acknowledge a pump's QoS 1/2 messages"""
+    # Publishes are queued without blocking; acknowledgements are collected
+    # here for the whole batch instead of waiting after every message
+    if not pending or CONFIG.confirm_timeout <= 0:
+        return
+    # The workers wait in parallel, so the slowest pump's wait adds to the
+    # cycle time; cap it well inside the publish interval so one slow
+    # acknowledgement cannot make every cycle overrun its deadline
+    timeout = min(CONFIG.confirm_timeout, CONFIG.publish_interval / 2)
+    deadline = time.monotonic() + timeout
+    for info in pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        info.wait_for_publish(remaining)
+    unconfirmed = sum(1 for info in pending if not info.is_published())
+    if unconfirmed:
+        logger.warning("⚠️  %s of %s messages for %s not acknowledged within %ss", unconfirmed, len(pending), pump.name, timeout)
+
+def build_alert_variants(pump, ts):
+    """Build the alert payload for every alert type in both acknowledgment states"""
+    topic = PUMP_TOPICS[pump.id]["alert"]
+    for alert in ALERT_TYPES:
+        for is_acknowledged in (False, True):
+            payload = create_alert_payload(pump, ts, alert, is_acknowledged)
+            state = "acknowledged" if is_acknowledged else "unacknowledged"
+            yield (topic, payload, f"{alert['code']} {state}")
+
+def self_test_payloads():
+    """Validate every payload shape the pump builders can produce against their schemas"""
+    ts = get_timestamp()
+    checked = failed = 0
+    for pump in PUMPS:
+        messages, _ = build_pump_messages(pump, ts)
+        # A cycle only contains one randomly picked alert shape, so every
+        # alert type and acknowledgment state is checked explicitly
+        messages.extend(build_alert_variants(pump, ts))
+        for topic, payload, description in messages:
+            schema_name = detect_schema(topic, payload)
+            if schema_name is None:
+                continue
+            checked += 1
+            if schema_name not in SCHEMAS:
+                logger.error("❌ %-20s → No compiled schema %s for %s", description, schema_name, topic)
+                failed += 1
+            elif not validate_payload(payload, schema_name, SCHEMAS):
+                logger.error("❌ %-20s → Self-test failed for %s", description, topic)
+                failed += 1
+    if failed:
+        logger.error("❌ Payload self-test failed: %s of %s payloads are invalid", failed, checked)
+        return False
+    logger.info("✅ Payload self-test passed: %s payloads match their schemas", checked)
+    return True
+
+def publish_pump_data():
+    """Main function to publish pump data using all schema types"""
+    # Apart from the alert variants the self-test builds explicitly, builders
+    # only vary payload values, so validating their shapes up front stands in
+    # for validating every publish
+    if not self_test_payloads():
+        sys.exit(1)
+    # One client per pump so publishes are not serialized on a single socket;
+    # a worker thread per pump builds and publishes that pump's payloads
+    clients = {pump.id: create_pump_client(pump) for pump in PUMPS}
+    executor = ThreadPoolExecutor(max_workers=len(PUMPS))
+    
     try:
-        client.connect(BROKER_ADDRESS, BROKER_PORT, MQTT_KEEPALIVE)
-        client.loop_start()
+        for client in clients.values():
+            client.connect(CONFIG.broker_address, CONFIG.broker_port, CONFIG.keepalive)
+            client.loop_start()
         time.sleep(2)
         cycle = 0
+        # Pace cycles against a monotonic deadline so the time spent publishing
+        # does not stretch the period beyond PUBLISH_INTERVAL
+        deadline = time.monotonic()
         while True:
             cycle += 1
-            print(f"\n🔄 Cycle {cycle} - {datetime.now().strftime('%H:%M:%S')}")
-            for pump in PUMPS:
-                print(f"\n🚰 Publishing for {pump['name']} (ID: {pump['id']})")
-                # Build base topic dynamically using UNS structure language
-                base_topic = f"{MQTT_TOPIC_ENTERPRISE}/{MQTT_TOPIC_SITE}/{MQTT_TOPIC_AREA}/{MQTT_TOPIC_LINE}/{MQTT_TOPIC_CELL}/{pump['name'].lower()}"
-                for schema_type, (description, payload_func) in SCHEMA_PAYLOADS.items():
-                    print(f"📤 Publishing {schema_type.upper()} payload...")
-                    try:
-                        if schema_type == "value":
-                            for value_type, (value_description, value_payload_func) in VALUE_PAYLOADS.items():
-                                print(f"  📊 {value_description}...")
-                                value_payloads = value_payload_func(pump)
-                                for topic_suffix, value_payload, value_desc in value_payloads:
-                                    topic = f"{base_topic}/{value_type}/{topic_suffix}"
-                                    if publish_payload(client, topic, value_payload):
-                                        print(f"    ✅ {value_desc:20} → {topic}")
-                                    else:
-                                        print(f"    ❌ {value_desc:20} → Validation failed")
-                        else:
-                            payload = payload_func(pump)
-                            topic = f"{base_topic}/{schema_type}"
-                            if publish_payload(client, topic, payload):
-                                print(f"  ✅ {description:20} → {topic}")
-                            else:
-                                print(f"  ❌ {description:20} → Validation failed")
-                    except Exception as e:
-                        logger.error(f"Error publishing {schema_type}: {e}")
-                        print(f"  ❌ {description:20} → Error: {e}")
-            print(f"⏳ Waiting {PUBLISH_INTERVAL} seconds until next cycle...")
-            time.sleep(PUBLISH_INTERVAL)
+            # One timestamp per cycle: every payload in a cycle describes the same moment
+            ts = get_timestamp()
+            if CONFIG.verbose:
+                print(f"\n▶️  Starting cycle {cycle}")
+            futures = [
+                executor.submit(publish_pump_cycle, clients[pump.id], pump, ts)
+                for pump in PUMPS
+            ]
+            published = built = 0
+            for future in futures:
+                pump_published, pump_built, lines = future.result()
+                published += pump_published
+                built += pump_built
+                if lines:
+                    print("\n".join(lines))
+            deadline += CONFIG.publish_interval
+            sleep_for = deadline - time.monotonic()
+            print(f"🔄 Cycle {cycle} - {datetime.now().strftime('%H:%M:%S')}: published {published}/{built} payloads for {len(PUMPS)} pumps")
+            if sleep_for > 0:
+                if CONFIG.verbose:
+                    print(f"⏳ Waiting {sleep_for:.2f} seconds until next cycle...")
+                time.sleep(sleep_for)
+            else:
+                logger.warning("⚠️  Cycle %s overran the publish interval by %.3fs", cycle, -sleep_for)
+                # Start the next period now rather than firing catch-up cycles back to back
+                deadline = time.monotonic()
     except KeyboardInterrupt:
         print(f"\n🛑 Stopping pump MQTT publisher...")
     except Exception as e:
-        logger.error(f"Connection error: {e}")
-        print(f"❌ Connection failed: {e}")
+        logger.error("❌ Connection failed: %s", e)
     finally:
-        client.loop_stop()
-        client.disconnect()
+        executor.shutdown()
+        for client in clients.values():
+            client.loop_stop()
+            client.disconnect()
         print("👋 Disconnected from MQTT broker")
 
-def publish_payload(client, topic, payload):
-    """Publish a payload to MQTT with schema validation"""
-    # Determine schema type from topic path first, then payload structure
-    schema_name = None
-    
-    # Topic-based detection (more reliable)
-    if '/edge/' in topic:
-        schema_name = 'reading'  # Edge payloads use reading schema
-    elif '/reading/' in topic:
-        schema_name = 'reading'
-    elif '/measurement/' in topic:
-        schema_name = 'measurement'
-    elif '/count/' in topic:
-        schema_name = 'count'
-    elif '/kpi/' in topic:
-        schema_name = 'kpi'
-    elif '/asset' in topic:
-        schema_name = 'asset'
-    elif '/alert' in topic:
-        schema_name = 'alert'
-    elif '/state' in topic:
-        schema_name = 'state'
-    elif '/product' in topic and '/production' not in topic:
-        schema_name = 'product'
-    elif '/production' in topic:
-        schema_name = 'production'
-    elif '/value' in topic:
-        schema_name = 'value'
+def build_static_payload_template(payload):
+    """Pre-encode a static payload as JSON bytes with a single slot for the timestamp"""
+    body = orjson.dumps({key: value for key, value in payload.items() if key != "timestamp"})
+    # Escape any literal % in the encoded body so only the timestamp slot is formatted
+    return b'{"timestamp":%b,' + body[1:].replace(b'%', b'%%')
+
+# Asset and product payloads are built from static pump configuration and only
+# their timestamp changes between cycles, so their topics map to pre-encoded
+# JSON templates built once from PAYLOAD_TEMPLATES
+STATIC_PAYLOAD_TEMPLATES = {
+    PUMP_TOPICS[pump_id][schema_name]: build_static_payload_template(template)
+    for pump_id, templates in PAYLOAD_TEMPLATES.items()
+    for schema_name, template in templates.items()
+}
+
+def serialize_payload(topic, payload):
+    """Encode a payload as compact JSON bytes, reusing pre-encoded static payload templates"""
+    template = STATIC_PAYLOAD_TEMPLATES.get(topic)
+    if template is None:
+        return orjson.dumps(payload)
+    return template % orjson.dumps(payload["timestamp"])
+
+# Topic segment that carries the schema type, e.g. .../pump-101/edge/temperature
+SCHEMA_BY_SEGMENT = {
+    'edge': 'reading',  # Edge payloads use reading schema
+    'reading': 'reading',
+    'measurement': 'measurement',
+    'count': 'count',
+    'kpi': 'kpi',
+    'asset': 'asset',
+    'alert': 'alert',
+    'state': 'state',
+    'product': 'product',
+    'production': 'production',
+    'value': 'value'
+}
+
+# Identifier keys that mark a payload's schema when the topic does not
+SCHEMA_BY_ID_KEY = {
+    'assetId': 'asset',
+    'alertId': 'alert',
+    'stateId': 'state',
+    'measurementId': 'measurement',
+    'countId': 'count',
+    'kpiId': 'kpi',
+    'productId': 'product',
+    'productionId': 'production',
+    'valueId': 'value'
+}
+
+def detect_schema(topic, payload):
+    """Determine the schema of a payload from its topic, falling back to its structure"""
+    # Topic-based detection (more reliable); scan from the leaf so the
+    # segment right under the asset wins over enterprise/site/area names
+    for segment in reversed(topic.split('/')):
+        schema_name = SCHEMA_BY_SEGMENT.get(segment)
+        if schema_name:
+            return schema_name
     
     # Fallback to payload structure detection if topic-based fails
-    if not schema_name:
-        if 'assetId' in payload:
-            schema_name = 'asset'
-        elif 'alertId' in payload:
-            schema_name = 'alert'
-        elif 'stateId' in payload:
-            schema_name = 'state'
-        elif 'measurementId' in payload:
-            schema_name = 'measurement'
-        elif 'countId' in payload:
-            schema_name = 'count'
-        elif 'kpiId' in payload:
-            schema_name = 'kpi'
-        elif 'productId' in payload:
-            schema_name = 'product'
-        elif 'productionId' in payload:
-            schema_name = 'production'
-        elif 'valueId' in payload:
-            schema_name = 'value'
-        elif 'type' in payload and 'value' in payload and 'unit' in payload:
-            # Reading schema has type, value, unit structure
-            schema_name = 'reading'
-    
-    # Validate payload against schema
-    if schema_name and not validate_payload(payload, schema_name, SCHEMAS):
-        logger.error(f"Payload validation failed, not publishing to {topic}")
+    for key, schema_name in SCHEMA_BY_ID_KEY.items():
+        if key in payload:
+            return schema_name
+    if 'type' in payload and 'value' in payload and 'unit' in payload:
+        # Reading schema has type, value, unit structure
+        return 'reading'
+    return None
+
+def publish_payload(client, topic, payload, pending=None):
+    """Publish a payload to MQTT with schema validation
+    
+    If a pending list is given, the message info of QoS 1/2 publishes is
+    appended to it so the caller can wait for acknowledgements in one batch.
+    """
+    # Determine schema type from topic path first, then payload structure
+    schema_name = detect_schema(topic, payload)
+    
+    # Validate payload against schema (optionally only a sample of payloads)
+    if schema_name and should_validate() and not validate_payload(payload, schema_name, SCHEMAS):
+        logger.error("Payload validation failed, not publishing to %s", topic)
         return False
     elif not schema_name:
-        print(f"⚠️  Could not determine schema type for topic: {topic}")
-        logger.warning(f"Could not determine schema type for topic: {topic}")
+        logger.warning("⚠️  Could not determine schema type for topic: %s", topic)
     
-    # Convert payload to JSON
-    payload_json = json.dumps(payload, indent=2)
+    # Convert payload to compact JSON bytes (paho publishes bytes as-is)
+    payload_json = serialize_payload(topic, payload)
     
     # Publish to MQTT
-    result = client.publish(topic, payload_json, qos=MQTT_QOS)
+    qos = QOS_BY_SCHEMA.get(schema_name, CONFIG.qos)
+    result = client.publish(topic, payload_json, qos=qos)
     
     if result.rc == mqtt.MQTT_ERR_SUCCESS:
-        logger.info(f"Published to {topic}")
-        logger.debug(f"Payload: {payload_json}")
+        if qos and pending is not None:
+            pending.append(result)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published to %s", topic)
+            logger.debug("Payload: %s", payload_json.decode())
         return True
     else:
-        logger.error(f"Failed to publish to {topic}: {result.rc}")
+        logger.error("Failed to publish to %s: %s", topic, result.rc)
         return False
 
 # =============================================================================
@@ -918,14 +1381,15 @@ if __name__ == "__main__":
     
     # Show configuration
     print(f"\n⚙️  Configuration:")
-    print(f"   📡 Broker: {BROKER_ADDRESS}:{BROKER_PORT}")
+    print(f"   📡 Broker: {CONFIG.broker_address}:{CONFIG.broker_port}")
     print(f"   🏭 Pumps:")
     for pump in PUMPS:
-        print(f"      - {pump['name']} (ID: {pump['id']})")
-    print(f"   ⏱️  Interval: {PUBLISH_INTERVAL} seconds")
-    print(f"   🔄 Random variation: {'Enabled' if ENABLE_RANDOM_VARIATION else 'Disabled'}")
-    print(f"   🔐 Authentication: {'Enabled' if MQTT_USE_AUTH else 'Disabled'}")
-    print(f"   🔒 TLS: {'Enabled' if MQTT_USE_TLS else 'Disabled'}")
-    print(f"   📝 Log Level: {LOG_LEVEL}")
+        print(f"      - {pump.name} (ID: {pump.id})")
+    print(f"   ⏱️  Interval: {CONFIG.publish_interval} seconds")
+    print(f"   🔄 Random variation: {'Enabled' if CONFIG.enable_random_variation else 'Disabled'}")
+    print(f"   🔐 Authentication: {'Enabled' if CONFIG.use_auth else 'Disabled'}")
+    print(f"   🔒 TLS: {'Enabled' if CONFIG.use_tls else 'Disabled'}")
+    print(f"   📝 Log Level: {CONFIG.log_level}")
+    print(f"   🗒️  Verbose output: {'Enabled' if CONFIG.verbose else 'Disabled'}")
     print("\n🔗 Connecting to MQTT broker...")
     publish_pump_data()
\ No newline at end of file
@@ -9,18 +9,20 @@ Usage:
     python tank_mqtt_publisher.py
 
 Requirements:
-    pip install paho-mqtt python-dotenv
+    pip install paho-mqtt python-dotenv fastjsonschema orjson
 """
 
-import json
 import time
 import random
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 import paho.mqtt.client as mqtt
 import logging
-from jsonschema import validate, ValidationError
+import fastjsonschema
+import orjson
 
 # =============================================================================
 # ENVIRONMENT CONFIGURATION
@@ -37,6 +39,7 @@ PASSWORD = os.getenv("MQTT_BROKER_PASSWORD", "")
 MQTT_CLIENT_ID = os.getenv("MQTT_CLIENT_ID", "uns-tank-example")
 MQTT_KEEPALIVE = int(os.getenv("MQTT_KEEPALIVE", "60"))
 MQTT_QOS = int(os.getenv("MQTT_QOS", "1"))
+MQTT_TELEMETRY_QOS = int(os.getenv("MQTT_TELEMETRY_QOS", "0"))
 
 # MQTT Topic Configuration
 MQTT_TOPIC_ENTERPRISE = os.getenv("MQTT_TOPIC_ENTERPRISE", "abelara")
@@ -45,31 +48,48 @@ MQTT_TOPIC_AREA = os.getenv("MQTT_TOPIC_AREA", "utilities")
 MQTT_TOPIC_LINE = os.getenv("MQTT_TOPIC_LINE", "water-system")
 MQTT_TOPIC_CELL = os.getenv("MQTT_TOPIC_CELL", "tank-area")
 
+# QoS per schema: telemetry is republished every cycle, so a lost message is
+# replaced on the next one and does not need broker acknowledgements. Schemas
+# not listed here (alerts, state, asset, ...) keep MQTT_QOS.
+QOS_BY_SCHEMA = {
+    "reading": MQTT_TELEMETRY_QOS,
+    "measurement": MQTT_TELEMETRY_QOS,
+    "count": MQTT_TELEMETRY_QOS,
+    "kpi": MQTT_TELEMETRY_QOS,
+    "value": MQTT_TELEMETRY_QOS
+}
+
 # Asset Configuration
 """
 Asset Configuration for two water tanks
 """
+# Tank records are read in every payload builder; attribute access on a
+# namedtuple is cheaper than a dict key lookup
+Tank = namedtuple("Tank", "id name description parent_id parent_name")
+
 TANKS = [
-    {
-        "id": 201,
-        "name": "Tank-201",
-        "description": "Raw water storage tank for process supply",
-        "parent_id": 31,
-        "parent_name": "Tank Area 1"
-    },
-    {
-        "id": 202,
-        "name": "Tank-202",
-        "description": "Treated water tank for distribution",
-        "parent_id": 31,
-        "parent_name": "Tank Area 1"
-    }
+    Tank(
+        id=201,
+        name="Tank-201",
+        description="Raw water storage tank for process supply",
+        parent_id=31,
+        parent_name="Tank Area 1"
+    ),
+    Tank(
+        id=202,
+        name="Tank-202",
+        description="Treated water tank for distribution",
+        parent_id=31,
+        parent_name="Tank Area 1"
+    )
 ]
 
 # Publisher Configuration
 PUBLISH_INTERVAL = int(os.getenv("PUBLISH_INTERVAL", "5"))
 ENABLE_RANDOM_VARIATION = os.getenv("SIMULATION_MODE", "true").lower() == "true"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Print every published message instead of one summary line per cycle
+VERBOSE = os.getenv("VERBOSE", "false").lower() == "true"
 
 # Optional: TLS/SSL Configuration
 MQTT_USE_TLS = os.getenv("MQTT_USE_TLS", "false").lower() == "true"
@@ -96,7 +116,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 def load_schemas():
-    """Load all JSON schemas for validation"""
+    """Load all JSON schemas and compile a validator function for each one"""
     schemas = {}
     schema_dir = os.path.join(os.path.dirname(__file__), '..', 'schemas')
     
@@ -116,31 +136,41 @@ def load_schemas():
     for schema_name, schema_path in schema_files.items():
         try:
             full_path = os.path.join(schema_dir, schema_path)
-            with open(full_path, 'r') as f:
-                schemas[schema_name] = json.load(f)
-            logger.debug(f"Loaded schema: {schema_name}")
+            with open(full_path, 'rb') as f:
+                schema = orjson.loads(f.read())
+            # Compile the schema into plain Python code once so each publish
+            # only runs the generated checks
+            schemas[schema_name] = fastjsonschema.compile(schema)
+            logger.debug("Loaded schema: %s", schema_name)
         except Exception as e:
-            logger.warning(f"Could not load schema {schema_name}: {e}")
+            logger.warning("Could not load schema %s: %s", schema_name, e)
     
     return schemas
 
+def log_validation_error(schema_name, error):
+    """Report a schema validation failure with the failing path and rule"""
+    # error.path starts with the root "data" element
+    path = ' -> '.join(str(p) for p in error.path[1:]) if len(error.path) > 1 else 'root'
+    expected = f"\n   Expected: {error.rule_definition}" if error.rule_definition else ""
+    logger.error(
+        "❌ Schema validation failed for %s:\n"
+        "   Error: %s\n"
+        "   Path: %s%s",
+        schema_name, error.message, path, expected
+    )
+
 def validate_payload(payload, schema_name, schemas):
-    """Validate a payload against its schema"""
-    if schema_name not in schemas:
-        logger.warning(f"No schema found for {schema_name}, skipping validation")
-        print(f"⚠️  No schema found for {schema_name}, skipping validation")
+    """Validate a payload against its compiled schema validator"""
+    validator = schemas.get(schema_name)
+    if validator is None:
+        logger.warning("⚠️  No schema found for %s, skipping validation", schema_name)
         return True
     
     try:
-        validate(instance=payload, schema=schemas[schema_name])
+        validator(payload)
         return True
-    except ValidationError as e:
-        logger.error(f"Schema validation failed for {schema_name}: {e}")
-        print(f"❌ Schema validation failed for {schema_name}:")
-        print(f"   Error: {e.message}")
-        print(f"   Path: {' -> '.join(str(p) for p in e.absolute_path) if e.absolute_path else 'root'}")
-        if e.validator_value:
-            print(f"   Expected: {e.validator_value}")
+    except fastjsonschema.JsonSchemaValueException as e:
+        log_validation_error(schema_name, e)
         return False
 
 # Load schemas at startup
@@ -153,21 +183,17 @@ SCHEMAS = load_schemas()
 def on_connect(client, userdata, flags, rc):
     """Called when connected to MQTT broker"""
     if rc == 0:
-        logger.info(f"Connected to MQTT broker at {BROKER_ADDRESS}:{BROKER_PORT}")
-        print(f"✅ Connected to MQTT broker at {BROKER_ADDRESS}:{BROKER_PORT}")
+        logger.info("✅ Connected to MQTT broker at %s:%s", BROKER_ADDRESS, BROKER_PORT)
     else:
-        logger.error(f"Failed to connect to MQTT broker. Return code: {rc}")
-        print(f"❌ Failed to connect to MQTT broker. Return code: {rc}")
+        logger.error("❌ Failed to connect to MQTT broker. Return code: %s", rc)
 
 def on_publish(client, userdata, mid):
     """Called when message is published"""
-    logger.debug(f"Published message ID: {mid}")
-    print(f"📤 Published message ID: {mid}")
+    logger.debug("Published message ID: %s", mid)
 
 def on_disconnect(client, userdata, rc):
     """Called when disconnected from MQTT broker"""
-    logger.info(f"Disconnected from MQTT broker. Return code: {rc}")
-    print(f"🔌 Disconnected from MQTT broker. Return code: {rc}")
+    logger.info("🔌 Disconnected from MQTT broker. Return code: %s", rc)
 
 # Create MQTT client
 client = mqtt.Client(client_id=MQTT_CLIENT_ID)
@@ -208,401 +234,510 @@ def add_variation(base_value, variation_percent=3):
     variation = base_value * (variation_percent / 100)
     return base_value + random.uniform(-variation, variation)
 
+def add_variations(base_values, variation_percent=3):
+    """Add realistic variation to a batch of values in a single pass"""
+    if not ENABLE_RANDOM_VARIATION:
+        return list(base_values)
+    # Same distribution as add_variation(), but drawing from random.random()
+    # directly keeps the loop free of Python-level random.uniform() frames
+    spread = 2 * variation_percent / 100
+    rand = random.random
+    return [base * (1 + spread * (rand() - 0.5)) for base in base_values]
+
 # =============================================================================
 # SCHEMA PAYLOADS
 # =============================================================================
 
-def create_asset_payload(tank):
-    """Create Asset schema payload for a given tank"""
+# Constant payload sub-trees shared by reference across payloads and cycles
+TANK_ASSET_TYPE = {
+    "id": 2,
+    "name": "Water Tank",
+    "description": "Water storage tank equipment"
+}
+
+# Tank nameplate details; only the serial number differs between tanks
+TANK_ASSET_INFO = {
+    tank.id: {
+        "manufacturer": "Pentair",
+        "model": "WT-5000",
+        "serialNumber": f"PT-2023-00{tank.id}",
+        "installationDate": "2023-04-10",
+        "capacity": "5000 m³",
+        "material": "Stainless Steel",
+        "maxLevel": "5.0 m",
+        "diameter": "10 m",
+        "height": "6 m"
+    }
+    for tank in TANKS
+}
+
+# Asset reference blocks embedded in every tank payload
+TANK_ASSET_REFS = {
+    tank.id: {"id": tank.id, "name": tank.name, "description": tank.description}
+    for tank in TANKS
+}
+TANK_ASSET_NAME_REFS = {tank.id: {"id": tank.id, "name": tank.name} for tank in TANKS}
+
+PRODUCT_FAMILY = {
+    "id": 1,
+    "name": "Utilities",
+    "description": "Utility products and services"
+}
+
+PRODUCT_SPECIFICATIONS = {
+    "temperature": "10-25°C",
+    "pressure": "1-2 bar",
+    "quality": "Process Grade",
+    "chlorinated": False
+}
+
+PRODUCT_REGULATORY_COMPLIANCE = ["ISO 14001", "Water Quality Standards"]
+
+# Product references embedded in value and production payloads
+PROCESS_WATER_PRODUCT_REF = {
+    "id": 2,
+    "name": "Process Water",
+    "description": "Water for manufacturing process"
+}
+
+PROCESS_WATER_PRODUCT = {
+    "id": 2,
+    "name": "Process Water",
+    "description": "Water for manufacturing process",
+    "family": PRODUCT_FAMILY
+}
+
+PROCESS_WATER_PRODUCT_DETAILS = {
+    "id": 2,
+    "name": "Process Water",
+    "description": "Water for manufacturing process and utilities",
+    "idealCycleTime": 3600,
+    "tolerance": 0.05,
+    "unit": "m³/h",
+    "family": PRODUCT_FAMILY
+}
+
+COUNT_ADDITIONAL_INFO = {
+    "lastMaintenance": "2025-01-15",
+    "nextMaintenance": "2025-06-15",
+    "lastReset": "2025-01-01T00:00:00Z",
+    "nextReset": "2026-01-01T00:00:00Z"
+}
+
+# Choice pools for randomized payload details
+OPERATING_MODES = ("AUTO", "MANUAL")
+STATE_OPERATORS = ("Alice Brown", "Tom Lee", "Eva Green")
+STAFF = ("Alice Brown", "Tom Lee", "Eva Green", "Sam Carter")
+MEASUREMENT_METHODS = ("Ultrasonic", "Thermocouple", "pH Meter", "Conductivity Probe")
+MEASUREMENT_EQUIPMENT = ("Endress+Hauser", "Hach HQ40d", "Siemens Probe")
+MEASUREMENT_TRENDS = ("Stable", "Rising", "Falling")
+MAINTENANCE_DEMANDS = ("Scheduled", "Emergency")
+KPI_TRENDS = ("Improving", "Stable", "Declining")
+ALERT_ACKNOWLEDGERS = ("Alice Brown", "Tom Lee", "Eva Green")
+ALERT_TRENDS = ("Rising", "Stable", "Falling")
+ALERT_ACTIONS = ("Monitor", "Check sensors", "Schedule maintenance", "Adjust inflow")
+ALERT_PRIORITIES = ("Low", "Medium", "High", "Critical")
+SHIFTS = ("Day", "Night", "Weekend")
+DEMAND_LEVELS = ("Low", "Medium", "High")
+
+TANK_STATES = (
+    {"id": 1, "name": "Filling", "description": "Tank is being filled", "color": "#00BFFF"},
+    {"id": 2, "name": "Full", "description": "Tank is full", "color": "#228B22"},
+    {"id": 3, "name": "Emptying", "description": "Tank is being emptied", "color": "#FFD700"},
+    {"id": 4, "name": "Low Level", "description": "Tank water level is low", "color": "#FF4500"},
+    {"id": 5, "name": "Maintenance", "description": "Tank under maintenance", "color": "#800080"}
+)
+
+# State payload blocks derived from TANK_STATES, indexed like TANK_STATES
+STATE_DESCRIPTIONS = tuple(f"Tank is {state['name'].lower()}" for state in TANK_STATES)
+STATE_TYPE_REFS = tuple(
+    {"id": state["id"], "name": state["name"], "description": state["description"]}
+    for state in TANK_STATES
+)
+PREVIOUS_STATE_REFS = tuple(
+    {
+        "id": state["id"],
+        "name": state["name"],
+        "description": state["description"],
+        "color": state["color"],
+        "type": state_type
+    }
+    for state, state_type in zip(TANK_STATES, STATE_TYPE_REFS)
+)
+
+def build_asset_template(tank):
+    """Build the static part of a tank's Asset schema payload"""
     return {
-        "timestamp": get_timestamp(),
-        "id": tank["id"],
-        "name": tank["name"],
-        "description": tank["description"],
-        "assetType": {
-            "id": 2,
-            "name": "Water Tank",
-            "description": "Water storage tank equipment"
-        },
+        "timestamp": None,
+        "id": tank.id,
+        "name": tank.name,
+        "description": tank.description,
+        "assetType": TANK_ASSET_TYPE,
         "parentAsset": {
-            "id": tank["parent_id"],
-            "name": tank["parent_name"],
+            "id": tank.parent_id,
+            "name": tank.parent_name,
             "description": "Primary water tank area"
         },
         "metadata": {
             "source": "asset-management",
-            "uri": f"asset://{tank['id']}",
-            "additionalInfo": {
-                "manufacturer": "Pentair",
-                "model": "WT-5000",
-                "serialNumber": f"PT-2023-00{tank['id']}",
-                "installationDate": "2023-04-10",
-                "capacity": "5000 m³",
-                "material": "Stainless Steel",
-                "maxLevel": "5.0 m",
-                "diameter": "10 m",
-                "height": "6 m"
-            }
+            "uri": f"asset://{tank.id}",
+            "additionalInfo": TANK_ASSET_INFO[tank.id]
         }
     }
 
-def create_state_payload(tank):
+def create_asset_payload(tank, ts=None):
+    """Create Asset schema payload for a given tank"""
+    if ts is None:
+        ts = get_timestamp()
+    payload = PAYLOAD_TEMPLATES[tank.id]["asset"].copy()
+    payload["timestamp"] = ts
+    return payload
+
+def create_state_payload(tank, ts=None):
     """Create State schema payload for a given tank"""
-    states = [
-        {"id": 1, "name": "Filling", "description": "Tank is being filled", "color": "#00BFFF"},
-        {"id": 2, "name": "Full", "description": "Tank is full", "color": "#228B22"},
-        {"id": 3, "name": "Emptying", "description": "Tank is being emptied", "color": "#FFD700"},
-        {"id": 4, "name": "Low Level", "description": "Tank water level is low", "color": "#FF4500"},
-        {"id": 5, "name": "Maintenance", "description": "Tank under maintenance", "color": "#800080"}
-    ]
-    current_state = random.choice(states)
-    previous_state = random.choice([s for s in states if s["id"] != current_state["id"]])
+    if ts is None:
+        ts = get_timestamp()
+    current_index = random.randrange(len(TANK_STATES))
+    # Offset by 1..N-1 so the previous state is any state except the current one
+    previous_index = (current_index + random.randrange(1, len(TANK_STATES))) % len(TANK_STATES)
     return {
-        "timestamp": get_timestamp(),
-        "description": f"Tank is {current_state['name'].lower()}",
-        "color": current_state["color"],
-        "type": {
-            "id": current_state["id"],
-            "name": current_state["name"],
-            "description": current_state["description"]
-        },
+        "timestamp": ts,
+        "description": STATE_DESCRIPTIONS[current_index],
+        "color": TANK_STATES[current_index]["color"],
+        "type": STATE_TYPE_REFS[current_index],
         "metadata": {
             "source": "plc-controller",
             "uri": "opc://plc1/DB1.DBW10",
-            "asset": {
-                "id": tank["id"],
-                "name": tank["name"],
-                "description": tank["description"]
-            },
-            "previousState": {
-                "id": previous_state["id"],
-                "name": previous_state["name"],
-                "description": previous_state["description"],
-                "color": previous_state["color"],
-                "type": {
-                    "id": previous_state["id"],
-                    "name": previous_state["name"],
-                    "description": previous_state["description"]
-                }
-            },
+            "asset": TANK_ASSET_REFS[tank.id],
+            "previousState": PREVIOUS_STATE_REFS[previous_index],
             "additionalInfo": {
-                "runTime": random.randint(500, 3000),
-                "lastFillTime": datetime.now(timezone.utc).isoformat(),
-                "mode": random.choice(["AUTO", "MANUAL"]),
-                "operator": random.choice(["Alice Brown", "Tom Lee", "Eva Green"])
+                "runTime": random.randrange(500, 3001),
+                "lastFillTime": ts,
+                "mode": random.choice(OPERATING_MODES),
+                "operator": random.choice(STATE_OPERATORS)
             }
         }
     }
 
-def create_measurement_payloads(tank):
+# Per-type settings for the multi-payload value builders, built once at import
+MeasurementType = namedtuple("MeasurementType", "id name description unit base_value target topic_suffix location")
+EdgeType = namedtuple("EdgeType", "id name description unit base_value topic_suffix location")
+# Counts increment by a random amount in [increment_min, increment_max] each cycle:
+# a float for fractional counts, a whole number otherwise
+CountType = namedtuple("CountType", "id name description unit base_value topic_suffix increment_min increment_max fractional")
+KpiType = namedtuple("KpiType", "id name description unit base_value topic_suffix")
+
+MEASUREMENT_TYPES = (
+    MeasurementType(id=1, name="Water Level", description="Tank water level measurement", unit="m", base_value=3.8, target=4.5, topic_suffix="water-level", location="Tank Center"),
+    MeasurementType(id=2, name="Temperature", description="Water temperature measurement", unit="°C", base_value=18.5, target=20.0, topic_suffix="temperature", location="Tank Bottom"),
+    MeasurementType(id=3, name="pH", description="Water pH measurement", unit="pH", base_value=7.2, target=7.0, topic_suffix="ph", location="Tank Outlet"),
+    MeasurementType(id=4, name="Conductivity", description="Water conductivity measurement", unit="µS/cm", base_value=320, target=300, topic_suffix="conductivity", location="Tank Outlet"),
+    MeasurementType(id=5, name="Volume", description="Tank water volume measurement", unit="m³", base_value=4200, target=5000, topic_suffix="volume", location="Tank Center")
+)
+
+# Measurement base values, varied in one add_variations() batch per call
+MEASUREMENT_BASE_VALUES = tuple(measurement.base_value for measurement in MEASUREMENT_TYPES)
+
+# 10% tolerance for tank measurements, paired with the rounded value reported in payloads
+MEASUREMENT_TOLERANCES = tuple(
+    (measurement.target * 0.10, round(measurement.target * 0.10, 2))
+    for measurement in MEASUREMENT_TYPES
+)
+
+def create_measurement_payloads(tank, ts=None):
     """Create multiple Measurement schema payloads for water tank maintenance and operator rounds"""
-    measurement_types = [
-        {"id": 1, "name": "Water Level", "description": "Tank water level measurement", "unit": "m", "base_value": 3.8, "target": 4.5, "topic_suffix": "water-level", "location": "Tank Center"},
-        {"id": 2, "name": "Temperature", "description": "Water temperature measurement", "unit": "°C", "base_value": 18.5, "target": 20.0, "topic_suffix": "temperature", "location": "Tank Bottom"},
-        {"id": 3, "name": "pH", "description": "Water pH measurement", "unit": "pH", "base_value": 7.2, "target": 7.0, "topic_suffix": "ph", "location": "Tank Outlet"},
-        {"id": 4, "name": "Conductivity", "description": "Water conductivity measurement", "unit": "µS/cm", "base_value": 320, "target": 300, "topic_suffix": "conductivity", "location": "Tank Outlet"},
-        {"id": 5, "name": "Volume", "description": "Tank water volume measurement", "unit": "m³", "base_value": 4200, "target": 5000, "topic_suffix": "volume", "location": "Tank Center"}
-    ]
-    
+    if ts is None:
+        ts = get_timestamp()
     payloads = []
-    for measurement in measurement_types:
-        value = add_variation(measurement["base_value"])
-        tolerance = measurement["target"] * 0.10  # 10% tolerance for tank measurements
-        in_tolerance = abs(value - measurement["target"]) <= tolerance
+    values = add_variations(MEASUREMENT_BASE_VALUES)
+    for measurement, value, (tolerance, reported_tolerance) in zip(MEASUREMENT_TYPES, values, MEASUREMENT_TOLERANCES):
+        in_tolerance = abs(value - measurement.target) <= tolerance
         
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "type": {
-                "id": measurement["id"],
-                "name": measurement["name"],
-                "description": measurement["description"]
+                "id": measurement.id,
+                "name": measurement.name,
+                "description": measurement.description
             },
             "value": round(value, 2),
-            "unit": measurement["unit"],
-            "target": measurement["target"],
-            "tolerance": round(tolerance, 2),
+            "unit": measurement.unit,
+            "target": measurement.target,
+            "tolerance": reported_tolerance,
             "inTolerance": in_tolerance,
             "metadata": {
                 "source": "tank-maintenance",
-                "uri": f"maintenance://{tank['name'].lower()}/{measurement['name'].lower().replace(' ', '-')}",
-                "asset": {
-                    "id": tank["id"],
-                    "name": tank["name"],
-                    "description": tank["description"]
-                },
+                "uri": f"maintenance://{tank.name.lower()}/{measurement.name.lower().replace(' ', '-')}",
+                "asset": TANK_ASSET_REFS[tank.id],
                 "additionalInfo": {
-                    "technician": random.choice(["Alice Brown", "Tom Lee", "Eva Green", "Sam Carter"]),
-                    "measurementMethod": random.choice(["Ultrasonic", "Thermocouple", "pH Meter", "Conductivity Probe"]),
-                    "equipmentUsed": random.choice(["Endress+Hauser", "Hach HQ40d", "Siemens Probe"]),
-                    "measurementDate": datetime.now(timezone.utc).isoformat(),
+                    "technician": random.choice(STAFF),
+                    "measurementMethod": random.choice(MEASUREMENT_METHODS),
+                    "equipmentUsed": random.choice(MEASUREMENT_EQUIPMENT),
+                    "measurementDate": ts,
                     "nextMeasurementDue": "2025-06-15",
-                    "trend": random.choice(["Stable", "Rising", "Falling"]),
-                    "measurementLocation": measurement["location"]
-                }
-            },
-            "product": {
-                "id": 2,
-                "name": "Process Water",
-                "description": "Water for manufacturing process",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
+                    "trend": random.choice(MEASUREMENT_TRENDS),
+                    "measurementLocation": measurement.location
                 }
             },
+            "product": PROCESS_WATER_PRODUCT,
             "productionContext": {
-                "batchId": f"TANK-2025-{random.randint(1, 999):03d}",
+                "batchId": f"TANK-2025-{random.randrange(1, 1000):03d}",
                 "processStep": "Tank Maintenance",
-                "demand": random.choice(["Scheduled", "Emergency"])
+                "demand": random.choice(MAINTENANCE_DEMANDS)
             }
         }
         
-        payloads.append((measurement["topic_suffix"], payload, f"{measurement['name']} measurement"))
+        payloads.append((measurement.topic_suffix, payload, f"{measurement.name} measurement"))
     
     return payloads
 
-def create_edge_payloads(tank):
+EDGE_TYPES = (
+    EdgeType(id=1, name="Inflow Rate", description="Water inflow rate", unit="m³/h", base_value=38.5, topic_suffix="inflow-rate", location="Inlet Pipe"),
+    EdgeType(id=2, name="Outflow Rate", description="Water outflow rate", unit="m³/h", base_value=36.2, topic_suffix="outflow-rate", location="Outlet Pipe"),
+    EdgeType(id=3, name="Temperature", description="Water temperature", unit="°C", base_value=18.5, topic_suffix="temperature", location="Tank Bottom"),
+    EdgeType(id=4, name="Pressure", description="Tank pressure", unit="bar", base_value=1.2, topic_suffix="pressure", location="Tank Top"),
+    EdgeType(id=5, name="Valve Position", description="Outlet valve position", unit="%", base_value=85, topic_suffix="valve-position", location="Outlet Valve")
+)
+
+EDGE_BASE_VALUES = tuple(edge_type.base_value for edge_type in EDGE_TYPES)
+
+# Edge reading sources, in EDGE_TYPES order
+EDGE_SOURCES = tuple(f"{edge_type.name.lower()}-sensor" for edge_type in EDGE_TYPES)
+
+def build_edge_sensor_info(tank):
+    """Build the static sensor details of each edge reading for a tank, in EDGE_TYPES order"""
+    return tuple(
+        {
+            "sensorId": f"{edge_type.name.upper().replace(' ', '')}-{tank.id:03d}",
+            "location": edge_type.location,
+            "alarmThreshold": edge_type.base_value * 1.2,
+            "warningThreshold": edge_type.base_value * 1.1,
+            "calibrationDate": "2025-01-15",
+            "nextCalibration": "2025-07-15"
+        }
+        for edge_type in EDGE_TYPES
+    )
+
+# Sensor details only depend on the tank and the edge type, so build them once
+EDGE_SENSOR_INFO = {tank.id: build_edge_sensor_info(tank) for tank in TANKS}
+
+def create_edge_payloads(tank, ts=None):
     """Create multiple Edge schema payloads for tank process readings"""
-    edge_types = [
-        {"id": 1, "name": "Inflow Rate", "description": "Water inflow rate", "unit": "m³/h", "base_value": 38.5, "topic_suffix": "inflow-rate", "location": "Inlet Pipe"},
-        {"id": 2, "name": "Outflow Rate", "description": "Water outflow rate", "unit": "m³/h", "base_value": 36.2, "topic_suffix": "outflow-rate", "location": "Outlet Pipe"},
-        {"id": 3, "name": "Temperature", "description": "Water temperature", "unit": "°C", "base_value": 18.5, "topic_suffix": "temperature", "location": "Tank Bottom"},
-        {"id": 4, "name": "Pressure", "description": "Tank pressure", "unit": "bar", "base_value": 1.2, "topic_suffix": "pressure", "location": "Tank Top"},
-        {"id": 5, "name": "Valve Position", "description": "Outlet valve position", "unit": "%", "base_value": 85, "topic_suffix": "valve-position", "location": "Outlet Valve"}
-    ]
-    
+    if ts is None:
+        ts = get_timestamp()
     payloads = []
-    for edge_type in edge_types:
-        value = add_variation(edge_type["base_value"])
+    sensor_infos = EDGE_SENSOR_INFO[tank.id]
+    values = add_variations(EDGE_BASE_VALUES)
+    for edge_type, value, source, sensor_info in zip(EDGE_TYPES, values, EDGE_SOURCES, sensor_infos):
         
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "type": {
-                "id": edge_type["id"],
-                "name": edge_type["name"],
-                "description": edge_type["description"]
+                "id": edge_type.id,
+                "name": edge_type.name,
+                "description": edge_type.description
             },
             "value": round(value, 2),
-            "unit": edge_type["unit"],
+            "unit": edge_type.unit,
             "metadata": {
-                "source": f"{edge_type['name'].lower()}-sensor",
-                "uri": f"opc://plc1/DB1.DBD{random.randint(40, 60)}",
-                "asset": {
-                    "id": tank["id"],
-                    "name": tank["name"],
-                    "description": tank["description"]
-                },
-                "additionalInfo": {
-                    "sensorId": f"{edge_type['name'].upper().replace(' ', '')}-{tank['id']:03d}",
-                    "location": edge_type["location"],
-                    "alarmThreshold": edge_type["base_value"] * 1.2,
-                    "warningThreshold": edge_type["base_value"] * 1.1,
-                    "calibrationDate": "2025-01-15",
-                    "nextCalibration": "2025-07-15"
-                }
+                "source": source,
+                "uri": f"opc://plc1/DB1.DBD{random.randrange(40, 61)}",
+                "asset": TANK_ASSET_REFS[tank.id],
+                "additionalInfo": sensor_info
             }
         }
         
-        payloads.append((edge_type["topic_suffix"], payload, f"{edge_type['name']} reading"))
+        payloads.append((edge_type.topic_suffix, payload, f"{edge_type.name} reading"))
     
     return payloads
 
-def create_count_payloads(tank):
+COUNT_TYPES = (
+    CountType(id=1, name="Total Inflow", description="Total water inflow to tank", unit="m³", base_value=12000, topic_suffix="total-inflow", increment_min=10, increment_max=20, fractional=True),
+    CountType(id=2, name="Total Outflow", description="Total water outflow from tank", unit="m³", base_value=11800, topic_suffix="total-outflow", increment_min=10, increment_max=20, fractional=True),
+    CountType(id=3, name="Fill Cycles", description="Number of fill cycles", unit="count", base_value=45, topic_suffix="fill-cycles", increment_min=0, increment_max=1, fractional=False),
+    CountType(id=4, name="Drain Cycles", description="Number of drain cycles", unit="count", base_value=44, topic_suffix="drain-cycles", increment_min=0, increment_max=1, fractional=False)
+)
+
+def create_count_payloads(tank, ts=None):
     """Create multiple Count schema payloads for tank accumulated values"""
-    count_types = [
-        {"id": 1, "name": "Total Inflow", "description": "Total water inflow to tank", "unit": "m³", "base_value": 12000, "topic_suffix": "total-inflow", "increment": lambda: random.uniform(10, 20)},
-        {"id": 2, "name": "Total Outflow", "description": "Total water outflow from tank", "unit": "m³", "base_value": 11800, "topic_suffix": "total-outflow", "increment": lambda: random.uniform(10, 20)},
-        {"id": 3, "name": "Fill Cycles", "description": "Number of fill cycles", "unit": "count", "base_value": 45, "topic_suffix": "fill-cycles", "increment": lambda: random.randint(0, 1)},
-        {"id": 4, "name": "Drain Cycles", "description": "Number of drain cycles", "unit": "count", "base_value": 44, "topic_suffix": "drain-cycles", "increment": lambda: random.randint(0, 1)}
-    ]
-    
+    if ts is None:
+        ts = get_timestamp()
     payloads = []
-    for count_type in count_types:
-        increment = count_type["increment"]()
-        value = count_type["base_value"] + increment
+    for count_type in COUNT_TYPES:
+        fractional = count_type.fractional
+        if fractional:
+            increment = random.uniform(count_type.increment_min, count_type.increment_max)
+        else:
+            increment = random.randrange(count_type.increment_min, count_type.increment_max + 1)
+        value = count_type.base_value + increment
         
         payload = {
-            "timestamp": get_timestamp(),
-            "value": round(value, 1) if count_type["unit"] == "m³" else int(value),
-            "unit": count_type["unit"],
+            "timestamp": ts,
+            "value": round(value, 1) if fractional else int(value),
+            "unit": count_type.unit,
             "type": {
-                "id": count_type["id"],
-                "name": count_type["name"],
-                "description": count_type["description"]
+                "id": count_type.id,
+                "name": count_type.name,
+                "description": count_type.description
             },
             "metadata": {
                 "source": "tank-counter",
                 "uri": "opc://plc1/DB1.DBD50",
-                "asset": {
-                    "id": tank["id"],
-                    "name": tank["name"],
-                    "description": tank["description"]
-                },
+                "asset": TANK_ASSET_REFS[tank.id],
                 "production": {
-                    "id": random.randint(2000, 2999),
-                    "name": f"Tank Operation {random.randint(1, 100)}",
+                    "id": random.randrange(2000, 3000),
+                    "name": f"Tank Operation {random.randrange(1, 101)}",
                     "description": "Water tank operation cycle"
                 },
-                "product": {
-                    "id": 2,
-                    "name": "Process Water",
-                    "description": "Water for manufacturing process"
-                },
-                "additionalInfo": {
-                    "lastMaintenance": "2025-01-15",
-                    "nextMaintenance": "2025-06-15",
-                    "lastReset": "2025-01-01T00:00:00Z",
-                    "nextReset": "2026-01-01T00:00:00Z"
-                }
+                "product": PROCESS_WATER_PRODUCT_REF,
+                "additionalInfo": COUNT_ADDITIONAL_INFO
             }
         }
         
-        payloads.append((count_type["topic_suffix"], payload, f"{count_type['name']} count"))
+        payloads.append((count_type.topic_suffix, payload, f"{count_type.name} count"))
     
     return payloads
 
-def create_kpi_payloads(tank):
+KPI_TYPES = (
+    KpiType(id=1, name="Fill Efficiency", description="Tank fill efficiency", unit="%", base_value=97.5, topic_suffix="fill-efficiency"),
+    KpiType(id=2, name="Drain Efficiency", description="Tank drain efficiency", unit="%", base_value=96.2, topic_suffix="drain-efficiency"),
+    KpiType(id=3, name="Water Quality Index", description="Water quality index", unit="index", base_value=98.8, topic_suffix="quality-index")
+)
+
+KPI_BASE_VALUES = tuple(kpi_type.base_value for kpi_type in KPI_TYPES)
+
+def create_kpi_payloads(tank, ts=None):
     """Create multiple KPI schema payloads for tank performance metrics"""
-    kpi_types = [
-        {"id": 1, "name": "Fill Efficiency", "description": "Tank fill efficiency", "unit": "%", "base_value": 97.5, "topic_suffix": "fill-efficiency"},
-        {"id": 2, "name": "Drain Efficiency", "description": "Tank drain efficiency", "unit": "%", "base_value": 96.2, "topic_suffix": "drain-efficiency"},
-        {"id": 3, "name": "Water Quality Index", "description": "Water quality index", "unit": "index", "base_value": 98.8, "topic_suffix": "quality-index"}
-    ]
-    
+    if ts is None:
+        ts = get_timestamp()
     payloads = []
-    for kpi_type in kpi_types:
-        value = add_variation(kpi_type["base_value"])
+    values = add_variations(KPI_BASE_VALUES)
+    for kpi_type, value in zip(KPI_TYPES, values):
         
         payload = {
-            "timestamp": get_timestamp(),
+            "timestamp": ts,
             "value": round(value, 2),
-            "unit": kpi_type["unit"],
+            "unit": kpi_type.unit,
             "type": {
-                "id": kpi_type["id"],
-                "name": kpi_type["name"],
-                "description": kpi_type["description"]
-            },
-            "product": {
-                "id": 2,
-                "name": "Process Water",
-                "description": "Water for manufacturing process",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
-                }
+                "id": kpi_type.id,
+                "name": kpi_type.name,
+                "description": kpi_type.description
             },
+            "product": PROCESS_WATER_PRODUCT,
             "metadata": {
                 "source": "kpi-calculator",
-                "uri": f"kpi://{tank['name'].lower()}/{kpi_type['name'].lower().replace(' ', '-')}",
-                "asset": {
-                    "id": tank["id"],
-                    "name": tank["name"]
-                },
+                "uri": f"kpi://{tank.name.lower()}/{kpi_type.name.lower().replace(' ', '-')}",
+                "asset": TANK_ASSET_NAME_REFS[tank.id],
                 "additionalInfo": {
                     "calculationPeriod": "1 hour",
-                    "trend": random.choice(["Improving", "Stable", "Declining"]),
-                    "lastCalculation": datetime.now(timezone.utc).isoformat(),
-                    "baselineValue": kpi_type["base_value"],
-                    "improvement": round((value - kpi_type["base_value"]) / kpi_type["base_value"] * 100, 2)
+                    "trend": random.choice(KPI_TRENDS),
+                    "lastCalculation": ts,
+                    "baselineValue": kpi_type.base_value,
+                    "improvement": round((value - kpi_type.base_value) / kpi_type.base_value * 100, 2)
                 }
             }
         }
         
-        payloads.append((kpi_type["topic_suffix"], payload, f"{kpi_type['name']} KPI"))
+        payloads.append((kpi_type.topic_suffix, payload, f"{kpi_type.name} KPI"))
     
     return payloads
 
-def create_alert_payload(tank):
+ALERT_TYPES = (
+    {"severity": 2, "code": "LEVEL_LOW", "message": "Tank water level below minimum threshold"},
+    {"severity": 3, "code": "LEVEL_HIGH", "message": "Tank water level exceeds maximum threshold"},
+    {"severity": 1, "code": "MAINT_DUE", "message": "Tank maintenance due within 50 hours"},
+    {"severity": 2, "code": "QUALITY_WARN", "message": "Water quality approaching warning threshold"},
+    {"severity": 3, "code": "QUALITY_ALARM", "message": "Water quality exceeds alarm threshold"}
+)
+
+def create_alert_payload(tank, ts=None):
     """Create Alert schema payload for tank"""
-    alert_types = [
-        {"severity": 2, "code": "LEVEL_LOW", "message": "Tank water level below minimum threshold"},
-        {"severity": 3, "code": "LEVEL_HIGH", "message": "Tank water level exceeds maximum threshold"},
-        {"severity": 1, "code": "MAINT_DUE", "message": "Tank maintenance due within 50 hours"},
-        {"severity": 2, "code": "QUALITY_WARN", "message": "Water quality approaching warning threshold"},
-        {"severity": 3, "code": "QUALITY_ALARM", "message": "Water quality exceeds alarm threshold"}
-    ]
-    
-    alert = random.choice(alert_types)
-    is_acknowledged = random.choice([True, False])
+    if ts is None:
+        ts = get_timestamp()
+    alert = random.choice(ALERT_TYPES)
+    is_acknowledged = random.random() < 0.5
     
     acknowledgment = {
         "acknowledged": is_acknowledged,
-        "acknowledgedBy": random.choice(["Alice Brown", "Tom Lee", "Eva Green"]) if is_acknowledged else None,
-        "acknowledgedAt": get_timestamp() if is_acknowledged else None
+        "acknowledgedBy": random.choice(ALERT_ACKNOWLEDGERS) if is_acknowledged else None,
+        "acknowledgedAt": ts if is_acknowledged else None
     }
     
     return {
-        "timestamp": get_timestamp(),
+        "timestamp": ts,
         "severity": alert["severity"],
         "code": alert["code"],
         "message": alert["message"],
         "metadata": {
             "source": "monitoring-system",
             "uri": "opc://plc1/DB1.DBD44",
-            "asset": {
-                "id": tank["id"],
-                "name": tank["name"],
-                "description": tank["description"]
-            },
+            "asset": TANK_ASSET_REFS[tank.id],
             "acknowledgment": acknowledgment,
             "additionalInfo": {
                 "waterLevel": round(add_variation(3.8), 2),
                 "minThreshold": 1.0,
                 "maxThreshold": 5.0,
                 "sensorLocation": "Tank Center",
-                "trend": random.choice(["Rising", "Stable", "Falling"]),
-                "timeInAlarm": random.randint(2, 20),
-                "recommendedAction": random.choice(["Monitor", "Check sensors", "Schedule maintenance", "Adjust inflow"]),
-                "priority": random.choice(["Low", "Medium", "High", "Critical"])
+                "trend": random.choice(ALERT_TRENDS),
+                "timeInAlarm": random.randrange(2, 21),
+                "recommendedAction": random.choice(ALERT_ACTIONS),
+                "priority": random.choice(ALERT_PRIORITIES)
             }
         }
     }
 
-def create_product_payload(tank):
-    """Create Product schema payload for tank"""
+def build_product_template(tank):
+    """Build the static part of a tank's Product schema payload"""
     return {
-        "timestamp": get_timestamp(),
+        "timestamp": None,
         "id": 2,
         "name": "Process Water",
         "description": "Water for manufacturing process and utilities",
         "idealCycleTime": 3600,
         "tolerance": 0.05,
         "unit": "m³/h",
-        "family": {
-            "id": 1,
-            "name": "Utilities",
-            "description": "Utility products and services"
-        },
+        "family": PRODUCT_FAMILY,
         "metadata": {
             "source": "product-management",
             "uri": "product://process-water",
-            "asset": {
-                "id": tank["id"],
-                "name": tank["name"],
-                "description": tank["description"]
-            },
+            "asset": TANK_ASSET_REFS[tank.id],
             "additionalInfo": {
-                "specifications": {
-                    "temperature": "10-25°C",
-                    "pressure": "1-2 bar",
-                    "quality": "Process Grade",
-                    "chlorinated": False
-                },
-                "regulatoryCompliance": ["ISO 14001", "Water Quality Standards"]
+                "specifications": PRODUCT_SPECIFICATIONS,
+                "regulatoryCompliance": PRODUCT_REGULATORY_COMPLIANCE
             }
         }
     }
 
-def create_production_payload(tank):
+# Asset and product payloads only depend on the tank, so they are built once
+# per tank and each cycle only copies the outer dict and sets the timestamp
+PAYLOAD_TEMPLATES = {
+    tank.id: {
+        "asset": build_asset_template(tank),
+        "product": build_product_template(tank)
+    }
+    for tank in TANKS
+}
+
+def create_product_payload(tank, ts=None):
+    """Create Product schema payload for tank"""
+    if ts is None:
+        ts = get_timestamp()
+    payload = PAYLOAD_TEMPLATES[tank.id]["product"].copy()
+    payload["timestamp"] = ts
+    return payload
+
+def create_production_payload(tank, ts=None):
     """Create Production schema payload for tank"""
-    water_inflow = random.randint(350, 400)
-    water_outflow = random.randint(340, 390)
+    if ts is None:
+        ts = get_timestamp()
+    water_inflow = random.randrange(350, 401)
+    water_outflow = random.randrange(340, 391)
     runtime_hours = random.uniform(5.5, 7.0)
+    system_efficiency, energy_consumption, quality_score = add_variations((97.5, 28.8, 98.8))
     
     return {
-        "timestamp": get_timestamp(),
-        "start_ts": datetime.now(timezone.utc).isoformat(),
+        "timestamp": ts,
+        "start_ts": ts,
         "end_ts": None,
         "counts": [
             {
@@ -613,7 +748,7 @@ def create_production_payload(tank):
                     "unit": "m³"
                 },
                 "quantity": water_inflow,
-                "timestamp": get_timestamp()
+                "timestamp": ts
             },
             {
                 "type": {
@@ -623,7 +758,7 @@ def create_production_payload(tank):
                     "unit": "m³"
                 },
                 "quantity": water_outflow,
-                "timestamp": get_timestamp()
+                "timestamp": ts
             },
             {
                 "type": {
@@ -633,37 +768,21 @@ def create_production_payload(tank):
                     "unit": "hours"
                 },
                 "quantity": round(runtime_hours, 1),
-                "timestamp": get_timestamp()
+                "timestamp": ts
             }
         ],
         "metadata": {
             "source": "production-tracker",
-            "uri": f"production://tank-system-2025-{random.randint(1, 999):03d}",
-            "asset": {
-                "id": tank["id"],
-                "name": tank["name"],
-                "description": tank["description"]
-            },
-            "product": {
-                "id": 2,
-                "name": "Process Water",
-                "description": "Water for manufacturing process and utilities",
-                "idealCycleTime": 3600,
-                "tolerance": 0.05,
-                "unit": "m³/h",
-                "family": {
-                    "id": 1,
-                    "name": "Utilities",
-                    "description": "Utility products and services"
-                }
-            },
+            "uri": f"production://tank-system-2025-{random.randrange(1, 1000):03d}",
+            "asset": TANK_ASSET_REFS[tank.id],
+            "product": PROCESS_WATER_PRODUCT_DETAILS,
             "additionalInfo": {
-                "shift": random.choice(["Day", "Night", "Weekend"]),
-                "operator": random.choice(["Alice Brown", "Tom Lee", "Eva Green", "Sam Carter"]),
-                "demandLevel": random.choice(["Low", "Medium", "High"]),
-                "systemEfficiency": round(add_variation(97.5), 1),
-                "energyConsumption": round(add_variation(28.8), 1),
-                "qualityScore": round(add_variation(98.8), 1),
+                "shift": random.choice(SHIFTS),
+                "operator": random.choice(STAFF),
+                "demandLevel": random.choice(DEMAND_LEVELS),
+                "systemEfficiency": round(system_efficiency, 1),
+                "energyConsumption": round(energy_consumption, 1),
+                "qualityScore": round(quality_score, 1),
                 "plannedProduction": 400,
                 "actualProduction": water_outflow,
                 "efficiency": round((water_outflow / 400) * 100, 1)
@@ -691,20 +810,107 @@ VALUE_PAYLOADS = {
     "edge": ("Edge sensor reading", create_edge_payloads)
 }
 
+# Topic suffixes each value builder publishes under its value-type topic
+VALUE_TOPIC_SUFFIXES = {
+    "measurement": tuple(measurement.topic_suffix for measurement in MEASUREMENT_TYPES),
+    "count": tuple(count_type.topic_suffix for count_type in COUNT_TYPES),
+    "kpi": tuple(kpi_type.topic_suffix for kpi_type in KPI_TYPES),
+    "edge": tuple(edge_type.topic_suffix for edge_type in EDGE_TYPES)
+}
+
+def build_tank_topics(tank):
+    """Build every schema and value payload topic for a tank using UNS structure language"""
+    base_topic = f"{MQTT_TOPIC_ENTERPRISE}/{MQTT_TOPIC_SITE}/{MQTT_TOPIC_AREA}/{MQTT_TOPIC_LINE}/{MQTT_TOPIC_CELL}/{tank.name.lower()}"
+    topics = {schema_type: f"{base_topic}/{schema_type}" for schema_type in SCHEMA_PAYLOADS}
+    for value_type, suffixes in VALUE_TOPIC_SUFFIXES.items():
+        for suffix in suffixes:
+            topics[(value_type, suffix)] = f"{base_topic}/{value_type}/{suffix}"
+    return topics
+
+# Topics only depend on static configuration, so build them once per tank
+TANK_TOPICS = {tank.id: build_tank_topics(tank) for tank in TANKS}
+
+# Schema each value type validates against; edge readings use the reading schema
+VALUE_SCHEMAS = {
+    "measurement": "measurement",
+    "count": "count",
+    "kpi": "kpi",
+    "edge": "reading"
+}
+
+# Flattened, fixed-order dispatch table for the publish loop:
+# (topic type, schema name, description, builder, builder returns multiple payloads)
+PAYLOAD_BUILDERS = tuple(
+    (schema_type, schema_type, description, payload_func, False)
+    for schema_type, (description, payload_func) in SCHEMA_PAYLOADS.items()
+    if payload_func is not None
+) + tuple(
+    (value_type, VALUE_SCHEMAS[value_type], description, payload_func, True)
+    for value_type, (description, payload_func) in VALUE_PAYLOADS.items()
+)
+
 # =============================================================================
 # MAIN PUBLISHING LOOP
 # =============================================================================
 
+def publish_tank_cycle(client, tank, ts):
+    """Build and publish one cycle of payloads for a single tank
+    
+    Returns the number of payloads published, the number attempted, and
+    the per-message console report (empty unless VERBOSE is set).
+    """
+    # Console output per message is opt-in: print() takes the stdout lock
+    # and writes a line for every publish, which dwarfs the publish itself.
+    # Report lines are collected and printed together so tanks publishing
+    # in parallel do not interleave their output
+    lines = [f"\n🛢️ Publishing for {tank.name} (ID: {tank.id})"] if VERBOSE else []
+    published = attempted = 0
+    topics = TANK_TOPICS[tank.id]
+    for topic_type, schema_name, description, payload_func, multiple in PAYLOAD_BUILDERS:
+        # Payloads this builder should account for, so a builder that raises
+        # still shows its lost payloads in the cycle summary
+        expected = attempted + (len(VALUE_TOPIC_SUFFIXES[topic_type]) if multiple else 1)
+        try:
+            if multiple:
+                for topic_suffix, value_payload, value_desc in payload_func(tank, ts):
+                    topic = topics[(topic_type, topic_suffix)]
+                    attempted += 1
+                    if publish_payload(client, topic, value_payload, schema_name):
+                        published += 1
+                        if VERBOSE:
+                            lines.append(f"  ✅ {value_desc:20} → {topic}")
+                    elif VERBOSE:
+                        lines.append(f"  ❌ {value_desc:20} → Validation failed")
+            else:
+                topic = topics[topic_type]
+                attempted += 1
+                if publish_payload(client, topic, payload_func(tank, ts), schema_name):
+                    published += 1
+                    if VERBOSE:
+                        lines.append(f"  ✅ {description:20} → {topic}")
+                elif VERBOSE:
+                    lines.append(f"  ❌ {description:20} → Validation failed")
+        except Exception as e:
+            logger.error("❌ %-20s → Error publishing %s for %s: %s", description, topic_type, tank.name, e)
+            attempted = max(attempted, expected)
+    return published, attempted, lines
+
 def publish_tank_data():
     """Main function to publish tank data using all schema types"""
     client = mqtt.Client()
     client.on_connect = on_connect
     client.on_disconnect = on_disconnect
-    client.on_publish = on_publish
+    # paho runs on_publish for every acknowledged message; only pay for
+    # the callback when its debug record would actually be emitted
+    if logger.isEnabledFor(logging.DEBUG):
+        client.on_publish = on_publish
     if USERNAME and PASSWORD:
         client.username_pw_set(USERNAME, PASSWORD)
     if MQTT_USE_TLS:
         client.tls_set()
+    # paho's publish() is thread-safe, so one worker per tank builds and
+    # publishes that tank's payloads over the shared client
+    executor = ThreadPoolExecutor(max_workers=len(TANKS))
     try:
         client.connect(BROKER_ADDRESS, BROKER_PORT, MQTT_KEEPALIVE)
         client.loop_start()
@@ -712,105 +918,68 @@ def publish_tank_data():
         cycle = 0
         while True:
             cycle += 1
-            print(f"\n🔄 Cycle {cycle} - {datetime.now().strftime('%H:%M:%S')}")
-            for tank in TANKS:
-                print(f"\n🛢️ Publishing for {tank['name']} (ID: {tank['id']})")
-                base_topic = f"{MQTT_TOPIC_ENTERPRISE}/{MQTT_TOPIC_SITE}/{MQTT_TOPIC_AREA}/{MQTT_TOPIC_LINE}/{MQTT_TOPIC_CELL}/{tank['name'].lower()}"
-                for schema_type, (description, payload_func) in SCHEMA_PAYLOADS.items():
-                    print(f"📤 Publishing {schema_type.upper()} payload...")
-                    try:
-                        if schema_type == "value":
-                            for value_type, (value_description, value_payload_func) in VALUE_PAYLOADS.items():
-                                print(f"  📊 {value_description}...")
-                                value_payloads = value_payload_func(tank)
-                                for topic_suffix, value_payload, value_desc in value_payloads:
-                                    topic = f"{base_topic}/{value_type}/{topic_suffix}"
-                                    if publish_payload(client, topic, value_payload):
-                                        print(f"    ✅ {value_desc:20} → {topic}")
-                                    else:
-                                        print(f"    ❌ {value_desc:20} → Validation failed")
-                        else:
-                            payload = payload_func(tank)
-                            topic = f"{base_topic}/{schema_type}"
-                            if publish_payload(client, topic, payload):
-                                print(f"  ✅ {description:20} → {topic}")
-                            else:
-                                print(f"  ❌ {description:20} → Validation failed")
-                    except Exception as e:
-                        logger.error(f"Error publishing {schema_type}: {e}")
-                        print(f"  ❌ {description:20} → Error: {e}")
-            print(f"⏳ Waiting {PUBLISH_INTERVAL} seconds until next cycle...")
+            # One timestamp per cycle: every payload in a cycle describes the
+            # same instant, so there is no need to format a new one per payload
+            ts = get_timestamp()
+            futures = [executor.submit(publish_tank_cycle, client, tank, ts) for tank in TANKS]
+            published = attempted = 0
+            for future in futures:
+                tank_published, tank_attempted, lines = future.result()
+                published += tank_published
+                attempted += tank_attempted
+                if lines:
+                    print("\n".join(lines))
+            print(f"🔄 Cycle {cycle} - {datetime.now().strftime('%H:%M:%S')}: published {published}/{attempted} payloads for {len(TANKS)} tanks")
+            if VERBOSE:
+                print(f"⏳ Waiting {PUBLISH_INTERVAL} seconds until next cycle...")
             time.sleep(PUBLISH_INTERVAL)
     except KeyboardInterrupt:
         print(f"\n🛑 Stopping tank MQTT publisher...")
     except Exception as e:
-        logger.error(f"Connection error: {e}")
-        print(f"❌ Connection failed: {e}")
+        logger.error("❌ Connection failed: %s", e)
     finally:
+        executor.shutdown()
         client.loop_stop()
         client.disconnect()
         print("👋 Disconnected from MQTT broker")
 
-def publish_payload(client, topic, payload):
+def build_static_payload_template(payload):
+    """Pre-encode a static payload as JSON bytes with a single slot for the timestamp"""
+    body = orjson.dumps({key: value for key, value in payload.items() if key != "timestamp"})
+    # Escape any literal % in the encoded body so only the timestamp slot is formatted
+    return b'{"timestamp":%b,' + body[1:].replace(b'%', b'%%')
+
+# Asset and product payloads are built from static tank configuration and only
+# their timestamp changes between cycles, so their topics map to pre-encoded
+# JSON templates built once from PAYLOAD_TEMPLATES
+STATIC_PAYLOAD_TEMPLATES = {
+    TANK_TOPICS[tank_id][schema_name]: build_static_payload_template(template)
+    for tank_id, templates in PAYLOAD_TEMPLATES.items()
+    for schema_name, template in templates.items()
+}
+
+def serialize_payload(topic, payload):
+    """Encode a payload as compact JSON bytes, reusing pre-encoded static payload templates"""
+    template = STATIC_PAYLOAD_TEMPLATES.get(topic)
+    if template is None:
+        return orjson.dumps(payload)
+    return template % orjson.dumps(payload["timestamp"])
+
+def publish_payload(client, topic, payload, schema_name):
     """Publish a payload to MQTT with schema validation"""
-    schema_name = None
-    if '/edge/' in topic:
-        schema_name = 'reading'
-    elif '/reading/' in topic:
-        schema_name = 'reading'
-    elif '/measurement/' in topic:
-        schema_name = 'measurement'
-    elif '/count/' in topic:
-        schema_name = 'count'
-    elif '/kpi/' in topic:
-        schema_name = 'kpi'
-    elif '/asset' in topic:
-        schema_name = 'asset'
-    elif '/alert' in topic:
-        schema_name = 'alert'
-    elif '/state' in topic:
-        schema_name = 'state'
-    elif '/product' in topic and '/production' not in topic:
-        schema_name = 'product'
-    elif '/production' in topic:
-        schema_name = 'production'
-    elif '/value' in topic:
-        schema_name = 'value'
-    if not schema_name:
-        if 'assetId' in payload:
-            schema_name = 'asset'
-        elif 'alertId' in payload:
-            schema_name = 'alert'
-        elif 'stateId' in payload:
-            schema_name = 'state'
-        elif 'measurementId' in payload:
-            schema_name = 'measurement'
-        elif 'countId' in payload:
-            schema_name = 'count'
-        elif 'kpiId' in payload:
-            schema_name = 'kpi'
-        elif 'productId' in payload:
-            schema_name = 'product'
-        elif 'productionId' in payload:
-            schema_name = 'production'
-        elif 'valueId' in payload:
-            schema_name = 'value'
-        elif 'type' in payload and 'value' in payload and 'unit' in payload:
-            schema_name = 'reading'
-    if schema_name and not validate_payload(payload, schema_name, SCHEMAS):
-        logger.error(f"Payload validation failed, not publishing to {topic}")
+    if not validate_payload(payload, schema_name, SCHEMAS):
+        logger.error("Payload validation failed, not publishing to %s", topic)
         return False
-    elif not schema_name:
-        print(f"⚠️  Could not determine schema type for topic: {topic}")
-        logger.warning(f"Could not determine schema type for topic: {topic}")
-    payload_json = json.dumps(payload, indent=2)
-    result = client.publish(topic, payload_json, qos=MQTT_QOS)
+    # Convert payload to compact JSON bytes (paho publishes bytes as-is)
+    payload_json = serialize_payload(topic, payload)
+    result = client.publish(topic, payload_json, qos=QOS_BY_SCHEMA.get(schema_name, MQTT_QOS))
     if result.rc == mqtt.MQTT_ERR_SUCCESS:
-        logger.info(f"Published to {topic}")
-        logger.debug(f"Payload: {payload_json}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published to %s", topic)
+            logger.debug("Payload: %s", payload_json.decode())
         return True
     else:
-        logger.error(f"Failed to publish to {topic}: {result.rc}")
+        logger.error("Failed to publish to %s: %s", topic, result.rc)
         return False
 
 # =============================================================================
@@ -827,11 +996,12 @@ if __name__ == "__main__":
     print(f"   📡 Broker: {BROKER_ADDRESS}:{BROKER_PORT}")
     print(f"   🛢️ Tanks:")
     for tank in TANKS:
-        print(f"      - {tank['name']} (ID: {tank['id']})")
+        print(f"      - {tank.name} (ID: {tank.id})")
     print(f"   ⏱️  Interval: {PUBLISH_INTERVAL} seconds")
     print(f"   🔄 Random variation: {'Enabled' if ENABLE_RANDOM_VARIATION else 'Disabled'}")
     print(f"   🔐 Authentication: {'Enabled' if MQTT_USE_AUTH else 'Disabled'}")
     print(f"   🔒 TLS: {'Enabled' if MQTT_USE_TLS else 'Disabled'}")
     print(f"   📝 Log Level: {LOG_LEVEL}")
+    print(f"   🗒️  Verbose output: {'Enabled' if VERBOSE else 'Disabled'}")
     print("\n🔗 Connecting to MQTT broker...")
     publish_tank_data()